@@ -0,0 +1,46 @@
+from __future__ import annotations
+from re import compile
+
+
+TOKEN = compile(r"\x1b\[(\??)([0-9;]*)([A-Za-z])|([\r\n\b])|(.)")
+
+
+class Terminal:
+    def __init__(self, width: int = 80) -> None:
+        self.width = width
+        self.cells: dict[tuple[int, int], str] = {}
+        self.x = self.y = 0
+
+    def feed(self, data: str) -> None:
+        for match in TOKEN.finditer(data):
+            private, parameters, final, control, character = match.groups()
+            if final is not None:
+                self.control_sequence(private, [int(parameter) if parameter else 0 for parameter in parameters.split(";")], final)
+            elif control == "\r":
+                self.x = 0
+            elif control == "\n":
+                self.y += 1
+            elif control == "\b":
+                self.x = max(self.x - 1, 0)
+            else:
+                self.cells[(self.x, self.y)] = character
+                self.x = min(self.x + 1, self.width - 1)  # Autowrap is disabled - the cursor stays on the last column
+
+    def control_sequence(self, private: str, parameters: list[int], final: str) -> None:
+        n = parameters[0] or 1
+        if private:
+            return
+        elif final == "H":
+            self.y = (parameters[0] or 1) - 1
+            self.x = (parameters[1] or 1) - 1 if len(parameters) > 1 else 0
+        elif final == "A":
+            self.y = max(self.y - n, 0)
+        elif final == "B":
+            self.y += n
+        elif final == "C":
+            self.x = min(self.x + n, self.width - 1)
+        elif final == "D":
+            self.x = max(self.x - n, 0)
+
+    def text(self, y: int, start: int, end: int) -> str:
+        return "".join(self.cells.get((x, y), " ") for x in range(start, end))
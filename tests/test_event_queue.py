@@ -0,0 +1,96 @@
+from queue import Full
+from threading import Thread
+from time import sleep
+from unittest import TestCase, main
+from xtermgui import Coordinate
+from xtermgui.input import DropPolicy, EventQueue, KeyboardEvent, MouseEvent
+
+
+def move(x: int) -> MouseEvent:
+    return MouseEvent("MOVE", Coordinate(x, 0))
+
+
+def drag(x: int) -> MouseEvent:
+    return MouseEvent("LEFT_MOUSE_DRAG", Coordinate(x, 0))
+
+
+class TestEventQueue(TestCase):
+    def test_consecutive_motion_is_coalesced(self) -> None:
+        queue = EventQueue(max_size=8)
+        for event in (move(0), move(1), drag(2), drag(3), KeyboardEvent("a"), move(4)):
+            self.assertTrue(queue.put(event))
+        self.assertEqual(list(queue.events), [move(1), drag(3), KeyboardEvent("a"), move(4)])
+        self.assertEqual(queue.dropped, 0)
+
+    def test_drop_oldest_evicts_the_oldest_motion(self) -> None:
+        queue = EventQueue(max_size=3, drop_policy=DropPolicy.DROP_OLDEST)
+        for event in (move(0), KeyboardEvent("a"), drag(1)):
+            queue.put(event)
+        self.assertTrue(queue.put(move(2)))
+        self.assertEqual(list(queue.events), [KeyboardEvent("a"), drag(1), move(2)])
+        self.assertEqual(queue.dropped, 1)
+
+    def test_drop_oldest_drops_motion_when_only_keys_are_queued(self) -> None:
+        queue = EventQueue(max_size=2, drop_policy=DropPolicy.DROP_OLDEST)
+        queue.put(KeyboardEvent("a"))
+        queue.put(KeyboardEvent("b"))
+        self.assertFalse(queue.put(move(0)))
+        self.assertEqual(list(queue.events), [KeyboardEvent("a"), KeyboardEvent("b")])
+        self.assertEqual(queue.dropped, 1)
+
+    def test_drop_newest_drops_the_incoming_motion(self) -> None:
+        queue = EventQueue(max_size=2, drop_policy=DropPolicy.DROP_NEWEST)
+        queue.put(move(0))
+        queue.put(KeyboardEvent("a"))
+        self.assertFalse(queue.put(drag(1)))
+        self.assertEqual(list(queue.events), [move(0), KeyboardEvent("a")])
+        self.assertEqual(queue.dropped, 1)
+
+    def test_keys_are_never_dropped(self) -> None:
+        for policy in (DropPolicy.DROP_OLDEST, DropPolicy.DROP_NEWEST):
+            with self.subTest(policy=policy):
+                queue = EventQueue(max_size=2, drop_policy=policy)
+                queue.put(move(0))
+                queue.put(KeyboardEvent("a"))
+                self.assertTrue(queue.put(KeyboardEvent("b")))
+                self.assertEqual(list(queue.events), [KeyboardEvent("a"), KeyboardEvent("b")])
+                with self.assertRaises(Full):
+                    queue.put(KeyboardEvent("c"), timeout=0.01)
+                self.assertEqual(list(queue.events), [KeyboardEvent("a"), KeyboardEvent("b")])
+
+    def test_block_waits_for_space(self) -> None:
+        queue = EventQueue(max_size=1, drop_policy=DropPolicy.BLOCK)
+        queue.put(move(0))
+        results = []
+        putter = Thread(target=lambda: results.append(queue.put(drag(1))))
+        putter.start()
+        sleep(0.05)
+        self.assertEqual(results, [])
+        self.assertEqual(queue.get(timeout=1), move(0))
+        putter.join(timeout=1)
+        self.assertEqual(results, [True])
+        self.assertEqual(list(queue.events), [drag(1)])
+        self.assertEqual(queue.dropped, 0)
+
+    def test_block_times_out_with_full(self) -> None:
+        queue = EventQueue(max_size=1, drop_policy=DropPolicy.BLOCK)
+        queue.put(move(0))
+        with self.assertRaises(Full):
+            queue.put(drag(1), timeout=0.01)
+        self.assertEqual(list(queue.events), [move(0)])
+
+    def test_close_releases_blocked_producers(self) -> None:
+        queue = EventQueue(max_size=1, drop_policy=DropPolicy.BLOCK)
+        queue.put(KeyboardEvent("a"))
+        results = []
+        putter = Thread(target=lambda: results.append(queue.put(KeyboardEvent("b"))))
+        putter.start()
+        sleep(0.05)
+        queue.close()
+        putter.join(timeout=1)
+        self.assertEqual(results, [False])
+        self.assertFalse(queue.put(KeyboardEvent("c")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+from unittest import TestCase, main
+from xtermgui import Colour, Coordinate, Grid, Rectangle, Text
+
+
+def red(character: str) -> Text:
+    return Text(character, colour=Colour((255, 0, 0)))
+
+
+class TestGrid(TestCase):
+    def test_grow_doubles_the_axis_it_needs(self) -> None:
+        grid = Grid()
+        grid[Coordinate(3, 2)] = "a"
+        self.assertEqual((grid.width, grid.height), (4, 3))
+        grid[Coordinate(4, 1)] = "b"
+        self.assertEqual((grid.width, grid.height), (8, 3))
+        grid[Coordinate(0, 3)] = "c"
+        self.assertEqual((grid.width, grid.height), (8, 6))
+        self.assertEqual(dict(grid.items()), {Coordinate(3, 2): "a", Coordinate(4, 1): "b", Coordinate(0, 3): "c"})
+        self.assertEqual(grid.sparse, {})
+
+    def test_far_outlier_is_stored_sparsely(self) -> None:
+        grid = Grid()
+        grid[Coordinate(1, 1)] = "a"
+        outlier = Coordinate(100_000, 5)
+        grid[outlier] = red("z")
+        self.assertIn(outlier, grid.sparse)
+        self.assertLess(grid.width * grid.height, Grid.MIN_DENSE_CELLS)
+        self.assertEqual(len(grid), 2)
+        self.assertEqual(grid[outlier], red("z"))
+        self.assertEqual(grid.row(5, 99_999, 100_001), [None, red("z")])
+        self.assertEqual(grid.get_size(), Coordinate(100_000, 5))
+        self.assertEqual(list(grid), [Coordinate(1, 1), outlier])
+        del grid[outlier]
+        self.assertEqual(grid.get_size(), Coordinate(1, 1))
+        self.assertEqual(len(grid), 1)
+
+    def test_resize_moves_sparse_cells_into_the_dense_block(self) -> None:
+        grid = Grid()
+        grid[Coordinate(100_000, 0)] = "z"
+        grid.resize(100_001, 1)
+        self.assertEqual(grid.sparse, {})
+        self.assertEqual(grid[Coordinate(100_000, 0)], "z")
+        self.assertEqual(len(grid), 1)
+
+    def test_extent_shrinks_after_deleting_edge_cells(self) -> None:
+        grid = Grid()
+        for at in (Coordinate(5, 1), Coordinate(2, 4), Coordinate(5, 3)):
+            grid[at] = "a"
+        del grid[Coordinate(2, 4)]
+        self.assertEqual(grid.get_size(), Coordinate(5, 3))
+        del grid[Coordinate(5, 3)]
+        self.assertEqual(grid.get_size(), Coordinate(5, 1))
+        del grid[Coordinate(5, 1)]
+        self.assertEqual((grid.right, grid.bottom), (-1, -1))
+
+    def test_compact_renumbers_effects_and_keeps_colours(self) -> None:
+        grid = Grid()
+        colours = [Colour((index, 0, 0)) for index in range(1, 5)]
+        for x, colour in enumerate(colours):
+            grid[Coordinate(x, 0)] = Text("a", colour=colour)
+        grid[Coordinate(90_000, 90_000)] = Text("s", colour=colours[3])
+        del grid[Coordinate(0, 0)]
+        del grid[Coordinate(2, 0)]
+        grid.compact()
+        self.assertEqual([colour for colour, _ in grid.effects[1:]], [colours[1], colours[3]])
+        self.assertEqual(sorted(set(grid.attributes)), [0, 1, 2])
+        self.assertEqual(grid[Coordinate(1, 0)].colour, colours[1])
+        self.assertEqual(grid[Coordinate(3, 0)].colour, colours[3])
+        self.assertEqual(grid[Coordinate(90_000, 90_000)].colour, colours[3])
+
+    def test_effects_table_compacts_when_full(self) -> None:
+        grid = Grid()
+        grid.effects_limit = 4
+        for index in range(1, 10):
+            grid[Coordinate(0, 0)] = Text("a", colour=Colour((index, 0, 0)))
+        self.assertNotIn(Colour((1, 0, 0)), [colour for colour, _ in grid.effects[1:]])
+        self.assertEqual(grid[Coordinate(0, 0)].colour, Colour((9, 0, 0)))
+
+    def test_dirty_rectangles_merge_matching_adjacent_rows(self) -> None:
+        grid = Grid()
+        for at in (Coordinate(1, 0), Coordinate(3, 0), Coordinate(1, 1), Coordinate(3, 1), Coordinate(2, 2), Coordinate(2, 4)):
+            grid[at] = "a"
+        self.assertEqual(grid.dirty_rectangles(), [
+            Rectangle(Coordinate(1, 0), Coordinate(4, 2)),
+            Rectangle(Coordinate(2, 2), Coordinate(3, 3)),
+            Rectangle(Coordinate(2, 4), Coordinate(3, 5)),
+        ])
+        grid.reset_dirty()
+        self.assertEqual(grid.dirty_rectangles(), [])
+
+
+if __name__ == "__main__":
+    main()
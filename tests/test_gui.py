@@ -0,0 +1,46 @@
+from io import StringIO
+from unittest import TestCase, main
+from xtermgui import GUI, Coordinate, Cursor, Output
+from terminal import Terminal
+
+
+class TestCommit(TestCase):
+    def setUp(self) -> None:
+        self.stream = StringIO()
+        self.output, self.terminal_width = Cursor.output, Cursor.terminal_width
+        Cursor.configure_output(Output(self.stream))
+        Cursor.configure_terminal_width(80)
+        self.gui = GUI()
+
+    def tearDown(self) -> None:
+        Cursor.configure_output(self.output)
+        Cursor.terminal_width = self.terminal_width
+
+    def test_gap_overwrite_starts_at_terminal_position(self) -> None:
+        self.gui.print("abcdef", at=Coordinate(0, 0))
+        self.gui.print("Y", at=Coordinate(0, 0))
+        self.stream.seek(0)
+        self.stream.truncate()
+        self.gui.print("Z", at=Coordinate(3, 0))
+        self.assertEqual(self.stream.getvalue(), "bcZ")
+        self.assertEqual("".join(self.gui.content[Coordinate(x, 0)] for x in range(6)), "YbcZef")
+
+    def test_last_column_leaves_terminal_position_unknown(self) -> None:
+        Cursor.position = Coordinate(79, 0)
+        Cursor.write("X")
+        self.assertIsNone(Cursor.terminal_position)
+        self.gui.print("X", at=Coordinate(79, 0))
+        self.gui.print("Y", at=Coordinate(78, 0))
+        terminal = Terminal(80)
+        terminal.feed(self.stream.getvalue())
+        self.assertEqual(terminal.text(0, 77, 80), " YX")
+
+    def test_wide_character_leaves_terminal_position_unknown(self) -> None:
+        Cursor.position = Coordinate(0, 1)
+        Cursor.write("\u6f22")
+        self.assertIsNone(Cursor.terminal_position)
+        Cursor.write("a")
+        self.assertEqual(Cursor.terminal_position, Coordinate(2, 1))
+
+if __name__ == "__main__":
+    main()
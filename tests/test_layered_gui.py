@@ -0,0 +1,93 @@
+from io import StringIO
+from unittest import TestCase, main
+from xtermgui import Colour, Coordinate, Cursor, LayeredGUI, Output, Text
+
+
+class TestLayeredGUI(TestCase):
+    def setUp(self) -> None:
+        self.output = Cursor.output
+        Cursor.configure_output(Output(StringIO()))
+        self.gui = LayeredGUI()
+        self.top = self.gui.add_layer("Top", 1)
+
+    def tearDown(self) -> None:
+        Cursor.configure_output(self.output)
+
+    def test_erase_reveals_the_layer_below(self) -> None:
+        self.gui.print("b", at=Coordinate(0, 0))
+        self.gui.print("t", at=Coordinate(0, 0), layer=self.top)
+        self.assertEqual(self.gui.content[Coordinate(0, 0)], "t")
+        self.gui.erase(at=Coordinate(0, 0), layer=self.top)
+        self.assertEqual(self.gui.content[Coordinate(0, 0)], "b")
+        self.gui.erase(at=Coordinate(0, 0))
+        self.assertEqual(self.gui.content[Coordinate(0, 0)], " ")
+
+    def test_hidden_layer_does_not_draw_over_higher_layers(self) -> None:
+        self.gui.print("t", at=Coordinate(0, 0), layer=self.top)
+        self.gui.print("b", at=Coordinate(0, 0))
+        self.assertEqual(self.gui.content[Coordinate(0, 0)], "t")
+        self.gui.erase(at=Coordinate(0, 0))
+        self.assertEqual(self.gui.content[Coordinate(0, 0)], "t")
+
+    def test_remove_layer_reveals_the_layer_below(self) -> None:
+        self.gui.print("b", at=Coordinate(0, 0))
+        self.gui.print("tt", at=Coordinate(0, 0), layer=self.top)
+        self.gui.remove_layer("Top")
+        self.assertEqual(self.gui.content.row(0, 0, 2), ["b", " "])
+        self.assertIsNone(self.gui.layers.get("Top"))
+        self.assertIs(self.gui.compositor.top_at(Coordinate(0, 0)), self.gui.base_layer)
+        self.assertIsNone(self.gui.compositor.top_at(Coordinate(1, 0)))
+
+    def test_set_z_restacks_the_visible_characters(self) -> None:
+        self.gui.print("b", at=Coordinate(0, 0))
+        self.gui.print("t", at=Coordinate(0, 0), layer=self.top)
+        self.gui.set_z(self.top, -1)
+        self.assertEqual(self.gui.content[Coordinate(0, 0)], "b")
+        self.assertEqual([layer.name for layer in self.gui.layers], ["Top", "Base"])
+        self.gui.raise_layer(self.top)
+        self.assertEqual(self.gui.content[Coordinate(0, 0)], "t")
+        self.gui.lower_layer(self.top)
+        self.assertEqual(self.gui.content[Coordinate(0, 0)], "b")
+
+    def test_registry_orders_equal_z_by_insertion_and_reuses_slots(self) -> None:
+        middle = self.gui.add_layer("Middle", 1)
+        self.assertEqual([layer.name for layer in self.gui.layers], ["Base", "Top", "Middle"])
+        self.assertEqual([layer.index for layer in self.gui.layers], [0, 1, 2])
+        with self.assertRaises(ValueError):
+            self.gui.add_layer("Middle")
+        slot = self.top.slot
+        self.gui.remove_layer("Top")
+        self.assertEqual(middle.index, 1)
+        self.assertEqual(self.gui.add_layer("Other", 0).slot, slot)
+
+    def test_layer_extent_shrinks_after_erasing_edge_cells(self) -> None:
+        self.gui.print("ab", at=Coordinate(3, 2), layer=self.top)
+        self.gui.print("c", at=Coordinate(1, 5), layer=self.top)
+        self.assertEqual(self.top.get_size(), Coordinate(4, 5))
+        self.gui.erase(at=Coordinate(1, 5), layer=self.top)
+        self.gui.erase(at=Coordinate(4, 2), layer=self.top)
+        self.assertEqual(self.top.get_size(), Coordinate(3, 2))
+
+    def test_compaction_keeps_colours(self) -> None:
+        self.gui.content.effects_limit = self.top.content.effects_limit = 4
+        colour = Colour((1, 2, 3))
+        self.gui.print(Text("k", colour=colour), at=Coordinate(0, 1), layer=self.top)
+        for index in range(10):
+            self.gui.print(Text("x", colour=Colour((index, 0, 0))), at=Coordinate(0, 0), layer=self.top)
+        self.assertEqual(self.gui.content[Coordinate(0, 1)].colour, colour)
+        self.assertEqual(self.top.content[Coordinate(0, 1)].colour, colour)
+        self.assertEqual(self.gui.content[Coordinate(0, 0)].colour, Colour((9, 0, 0)))
+        self.gui.commit()
+        self.assertEqual(self.gui.screen[Coordinate(0, 1)].colour, colour)
+
+    def test_as_active_binds_the_default_layer(self) -> None:
+        with self.gui.as_active(self.top):
+            self.gui.print("t", at=Coordinate(0, 0))
+        self.gui.print("b", at=Coordinate(1, 0))
+        self.assertIn(Coordinate(0, 0), self.top.content)
+        self.assertIn(Coordinate(1, 0), self.gui.base_layer.content)
+        self.assertIs(self.gui.active_layer, self.gui.base_layer)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+from io import StringIO
+from threading import Event, Thread
+from unittest import TestCase, main
+from xtermgui import GUI, Coordinate, Cursor, Output
+from terminal import Terminal
+
+
+class TestOutput(TestCase):
+    def setUp(self) -> None:
+        self.stream = StringIO()
+        self.output = Cursor.output
+        Cursor.configure_output(Output(self.stream))
+        Cursor.terminal_position = None
+
+    def tearDown(self) -> None:
+        Cursor.configure_output(self.output)
+
+    def test_batch_defers_only_its_own_flushes(self) -> None:
+        output = Output(StringIO())
+        with output.batch():
+            output.write("a")
+            self.assertEqual(output.stream.getvalue(), "")
+        self.assertEqual(output.stream.getvalue(), "a")
+
+    def test_batched_thread_does_not_hold_back_other_threads(self) -> None:
+        gui, printed, release = GUI(), Event(), Event()
+
+        def handler() -> None:
+            with gui.batch():
+                gui.print("A", at=Coordinate(5, 3))
+                printed.set()
+                release.wait()
+
+        thread = Thread(target=handler)
+        thread.start()
+        printed.wait()
+        gui.print("B", at=Coordinate(7, 3))
+        written = self.stream.getvalue()
+        release.set()
+        thread.join()
+        self.assertIn("B", written)
+        terminal = Terminal()
+        terminal.feed(self.stream.getvalue())
+        self.assertEqual(terminal.text(3, 5, 8), "A B")
+
+
+if __name__ == "__main__":
+    main()
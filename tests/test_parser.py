@@ -0,0 +1,73 @@
+from unittest import TestCase, main
+from xtermgui import Coordinate
+from xtermgui.input import InputParser, KeyboardEvent, MouseEvent
+
+
+class TestInputParser(TestCase):
+    def setUp(self) -> None:
+        self.parser = InputParser()
+
+    def names(self, data: str) -> list[str]:
+        return [event.name for event in self.parser.feed(data)]
+
+    def test_printable_and_control_characters(self) -> None:
+        self.assertEqual(self.names("a\t\n\x7f"), ["a", "TAB", "ENTER", "BACKSPACE"])
+
+    def test_csi_modifiers(self) -> None:
+        self.assertEqual(self.names("\x1b[A"), ["UP_ARROW"])
+        self.assertEqual(self.names("\x1b[1;2B"), ["SHIFT_DOWN_ARROW"])
+        self.assertEqual(self.names("\x1b[1;3C"), ["ALT_RIGHT_ARROW"])
+        self.assertEqual(self.names("\x1b[1;5D"), ["CTRL_LEFT_ARROW"])
+        self.assertEqual(self.names("\x1b[1;8H"), ["CTRL_ALT_SHIFT_HOME"])
+        self.assertEqual(self.names("\x1b[3;5~"), ["CTRL_DELETE"])
+        self.assertEqual(self.names("\x1b[24~"), ["F12"])
+
+    def test_function_keys_from_ss3_and_csi(self) -> None:
+        self.assertEqual(self.names("\x1bOP\x1bOQ\x1bOR\x1bOS"), ["F1", "F2", "F3", "F4"])
+        self.assertEqual(self.names("\x1b[P\x1b[1;2Q\x1b[1;5R\x1b[1;3S"), ["F1", "SHIFT_F2", "CTRL_F3", "ALT_F4"])
+
+    def test_alt_characters(self) -> None:
+        self.assertEqual(self.names("\x1bx\x1bX"), ["ALT_x", "ALT_X"])
+
+    def test_mouse_events(self) -> None:
+        self.assertEqual(self.parser.feed("\x1b[<0;10;5M"), [MouseEvent("LEFT_MOUSE_DOWN", Coordinate(9, 4))])
+        self.assertEqual(self.parser.feed("\x1b[<2;1;1m"), [MouseEvent("RIGHT_MOUSE_UP", Coordinate(0, 0))])
+        self.assertEqual(self.names("\x1b[<64;3;3M\x1b[<35;3;3M"), ["SCROLL_UP", "MOVE"])
+
+    def test_mouse_modifier_bits(self) -> None:
+        self.assertEqual(self.names("\x1b[<4;1;1M"), ["SHIFT_LEFT_MOUSE_DOWN"])
+        self.assertEqual(self.names("\x1b[<8;1;1M"), ["ALT_LEFT_MOUSE_DOWN"])
+        self.assertEqual(self.names("\x1b[<16;1;1M"), ["CTRL_LEFT_MOUSE_DOWN"])
+        self.assertEqual(self.names("\x1b[<48;1;1M"), ["CTRL_LEFT_MOUSE_DRAG"])
+        self.assertEqual(self.names("\x1b[<28;1;1m"), ["CTRL_ALT_SHIFT_LEFT_MOUSE_UP"])
+
+    def test_split_chunks(self) -> None:
+        self.assertEqual(self.names("\x1b["), [])
+        self.assertEqual(self.names("3~"), ["DELETE"])
+        self.assertEqual(self.names("a\x1b"), ["a"])
+        self.assertEqual(self.names("O"), [])
+        self.assertEqual(self.names("Pb"), ["F1", "b"])
+        self.assertEqual(self.names("\x1b[<0;1"), [])
+        self.assertEqual(self.names("0;5M"), ["LEFT_MOUSE_DOWN"])
+
+    def test_private_and_unknown_sequences(self) -> None:
+        unrecognized = KeyboardEvent.UNRECOGNIZED
+        self.assertEqual(self.names("\x1b[?1;2c"), [unrecognized])
+        self.assertEqual(self.names("\x1b[5X"), [unrecognized])
+        self.assertEqual(self.names("\x1b[99~"), [unrecognized])
+        self.assertEqual(self.names("\x1b[<1;1M"), [unrecognized])
+        self.assertEqual(self.names("\x1bOXa"), [unrecognized, "a"])
+
+    def test_incremental_feed_keeps_order_and_remainder(self) -> None:
+        data = "ab\x1b[1;5A\x1b[<0;2;3Mc\x1bOP"
+        expected = self.names(data)
+        self.assertEqual(expected, ["a", "b", "CTRL_UP_ARROW", "LEFT_MOUSE_DOWN", "c", "F1"])
+        parser, names = InputParser(), []
+        for character in data:
+            names.extend(event.name for event in parser.feed(character))
+        self.assertEqual(names, expected)
+        self.assertEqual(parser.buffer[parser.position:], "")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
-from .input import read_console, Event, Events, KeyboardEvent, MouseEvent, console_inputs
-from .geometry import Coordinate, Region
-from .control import Colour, Colours, ColourType, Cursor, RGB, RGBs, Style, Styles, Text
-from .gui import GUI, KeyboardInteraction, MouseInteraction
+from .input import read_console, DropPolicy, Event, EventQueue, Events, KeyboardEvent, MouseEvent, console_inputs
+from .geometry import Coordinate, Mask, Rectangle, Region
+from .control import Colour, ColourDepth, Colours, ColourType, Cursor, Output, RGB, RGBs, RichText, Span, Style, Styles, Text, Writer
+from .gui import GUI, Grid, KeyboardInteraction, MouseInteraction, Surface
 from .layered_gui import LayeredGUI, Layer
@@ -1,8 +1,14 @@
 from .colour import Colour, ColourType
 from .colours import Colours
+from .colour_depth import ColourDepth
 from .cursor import Cursor
+from .output import Output
+from .writer import Writer
+from .sgr import SGR
 from .rgb import RGB
 from .style import Style
 from .styles import Styles
 from .text import Text
+from .rich_text import RichText, Span
 from .rgbs import RGBs
+from . import blending
@@ -0,0 +1,96 @@
+from __future__ import annotations
+from typing import Sequence
+from .rgb import RGB
+try:
+    import numpy
+except ImportError:  # NumPy is an optional accelerator - fall back to pure Python
+    numpy = None
+
+
+RGBArray = Sequence[RGB | tuple[int, int, int]]
+Bias = float | Sequence[float]
+
+
+def is_single(colours: RGBArray | RGB | tuple[int, int, int]) -> bool:
+    return len(colours) == 3 and isinstance(colours[0], int)
+
+
+def validate(first: RGBArray, second: RGBArray | RGB, bias: Bias = 0.5) -> None:
+    if not is_single(second) and len(second) != len(first):
+        raise ValueError(f"Cannot blend {len(first)} colours with {len(second)} colours") from None
+    elif not isinstance(bias, (int, float)) and len(bias) != len(first):
+        raise ValueError(f"Cannot blend {len(first)} colours with {len(bias)} biases") from None
+
+
+def broadcast(colours: RGBArray | RGB | tuple[int, int, int], length: int) -> RGBArray:
+    if is_single(colours):
+        return [colours] * length
+    return colours
+
+
+def biases(bias: Bias, length: int) -> Sequence[float]:
+    return [bias] * length if isinstance(bias, (int, float)) else bias
+
+
+def as_rgbs(array: numpy.ndarray) -> list[RGB]:
+    return [RGB(*row) for row in array.astype(int).tolist()]
+
+
+def as_array(colours: RGBArray, length: int) -> numpy.ndarray:
+    return numpy.broadcast_to(numpy.asarray(colours, dtype=numpy.float64).reshape(-1, 3), (length, 3))
+
+
+def as_bias_array(bias: Bias, length: int) -> numpy.ndarray:
+    return numpy.broadcast_to(numpy.asarray(bias, dtype=numpy.float64).reshape(-1, 1), (length, 1))
+
+
+def additive_blend(first: RGBArray, second: RGBArray | RGB) -> list[RGB]:
+    validate(first, second)
+    if numpy is not None:
+        return as_rgbs(numpy.clip(as_array(first, len(first)) + as_array(second, len(first)), 0, 255))
+    return [
+        RGB(*(min(one + two, 255) for one, two in zip(colour, other)))
+        for colour, other in zip(first, broadcast(second, len(first)))
+    ]
+
+
+def mean_blend(first: RGBArray, second: RGBArray | RGB) -> list[RGB]:
+    validate(first, second)
+    if numpy is not None:
+        return as_rgbs(numpy.rint((as_array(first, len(first)) + as_array(second, len(first))) / 2))
+    return [
+        RGB(*(round((one + two) / 2) for one, two in zip(colour, other)))
+        for colour, other in zip(first, broadcast(second, len(first)))
+    ]
+
+
+def linear_blend(first: RGBArray, second: RGBArray | RGB, bias: Bias = 0.5) -> list[RGB]:
+    validate(first, second, bias)
+    if numpy is not None:
+        weights = as_bias_array(bias, len(first))
+        return as_rgbs(numpy.rint((1 - weights) * as_array(first, len(first)) + weights * as_array(second, len(first))))
+    return [
+        RGB(*(round((1 - weight) * one + weight * two) for one, two in zip(colour, other)))
+        for colour, other, weight in zip(first, broadcast(second, len(first)), biases(bias, len(first)))
+    ]
+
+
+def blend(first: RGBArray, second: RGBArray | RGB, bias: Bias = 0.5, gamma: float = 2.2) -> list[RGB]:
+    validate(first, second, bias)
+    if numpy is not None:
+        weights = as_bias_array(bias, len(first))
+        linear = (1 - weights) * as_array(first, len(first)) ** gamma + weights * as_array(second, len(first)) ** gamma
+        return as_rgbs(numpy.rint(linear ** (1 / gamma)))
+    inverse = 1 / gamma
+    return [
+        RGB(*(round(((1 - weight) * one ** gamma + weight * two ** gamma) ** inverse) for one, two in zip(colour, other)))
+        for colour, other, weight in zip(first, broadcast(second, len(first)), biases(bias, len(first)))
+    ]
+
+
+def gradient(start: RGB | tuple[int, int, int], end: RGB | tuple[int, int, int], steps: int, gamma: float = 2.2) -> list[RGB]:
+    if steps < 1:
+        return []
+    elif steps == 1:
+        return [RGB(*start)]
+    return blend([start] * steps, end, bias=[step / (steps - 1) for step in range(steps)], gamma=gamma)
@@ -40,7 +40,6 @@ class _Colour:
         return cls.DEFAULT_BACKGROUND
 
     def __post_init__(self) -> None:
-        object.__setattr__(self, "_initialized", True)
         if not isinstance(self.foreground, (Colour, RGB, tuple)) and self.foreground is not None:
             raise ValueError(f"Cannot initialize colour with {self.foreground = }") from None
         elif not isinstance(self.background, (Colour, RGB, tuple)) and self.background is not None:
@@ -51,6 +50,7 @@ class _Colour:
         background = background if isinstance(background, RGB) else RGB(*background)
         object.__setattr__(self, "foreground", foreground)
         object.__setattr__(self, "background", background)
+        object.__setattr__(self, "_initialized", True)
 
     def __add__(self, other: Colour) -> Colour:
         if not isinstance(other, Colour):
@@ -144,8 +144,46 @@ class _Colour:
 
 
 class Colour(_Colour):
+    INTERNED: ClassVar[dict[tuple[tuple[int, int, int], tuple[int, int, int], RGB], Colour]] = {}
+    MAX_INTERNED: ClassVar[int] = 4096
+
+    def __new__(cls, foreground: Optional[RGB | tuple[int, int, int]] = None, background: Optional[RGB | tuple[int, int, int]] = None) -> Colour:
+        if (key := cls.intern_key(foreground, background)) is not None and (colour := cls.INTERNED.get(key)) is not None:
+            return colour
+        return super().__new__(cls)
+
     def __init__(self, foreground: Optional[RGB | tuple[int, int, int]] = None, background: Optional[RGB | tuple[int, int, int]] = None) -> None:
+        if self._initialized:  # Interned - already validated
+            return
         super().__init__(foreground, background)
+        if (key := self.intern_key(foreground, background)) is not None:
+            if len(self.__class__.INTERNED) >= self.__class__.MAX_INTERNED:
+                del self.__class__.INTERNED[next(iter(self.__class__.INTERNED))]
+            self.__class__.INTERNED[key] = self
+
+    @classmethod
+    def intern_key(cls, foreground: Optional[RGB | tuple[int, int, int]], background: Optional[RGB | tuple[int, int, int]]) -> tuple[tuple[int, int, int], tuple[int, int, int], RGB] | None:
+        foreground = RGBs.DEFAULT_FOREGROUND.value if foreground is None else foreground
+        background = cls.DEFAULT_BACKGROUND if background is None else background
+        if not isinstance(foreground, tuple) or not isinstance(background, tuple):
+            return None
+        return foreground, background, cls.DEFAULT_BACKGROUND  # has_background depends on the default at creation
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        elif not isinstance(other, Colour):
+            return NotImplemented
+        return (
+            self._foreground == other._foreground and self._background == other._background
+            and self.has_foreground == other.has_foreground and self.has_background == other.has_background
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._foreground, self._background, self.has_foreground, self.has_background))
+
+    def __reduce__(self) -> tuple:
+        return self.__class__, (self.foreground, self.background)
 
     def __repr__(self):
         return super().__repr__().replace("_", "")
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class ColourDepth(Enum):
+    TRUECOLOR: str = "TRUECOLOR"
+    PALETTE_256: str = "PALETTE_256"
+    PALETTE_16: str = "PALETTE_16"
+    MONOCHROME: str = "MONOCHROME"
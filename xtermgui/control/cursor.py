@@ -1,99 +1,208 @@
 from __future__ import annotations
-import sys
+from io import StringIO
+from shutil import get_terminal_size
+from unicodedata import east_asian_width
+from .colour_depth import ColourDepth
+from .output import Output
+from .sgr import SGR, DEFAULT_SGR
 from .text import Text
 from ..geometry import Coordinate
+from ..utils import SupportsString, hybridmethod
 
 
 class Cursor:
     position = Coordinate(0, 0)
+    terminal_position: Coordinate | None = None
     visible = True
+    attributes = DEFAULT_SGR
+    output = Output()
+    colour_depth = ColourDepth.TRUECOLOR
+    terminal_width: int | None = get_terminal_size().columns
 
-    @classmethod
-    def up(cls, n: int = 1) -> type[Cursor]:
+    def __init__(self, output: Output | None = None, position: Coordinate = Coordinate(0, 0), colour_depth: ColourDepth = ColourDepth.TRUECOLOR, terminal_width: int | None = None) -> None:
+        self.position = position
+        self.terminal_position = None
+        self.visible = True
+        self.attributes = DEFAULT_SGR
+        self.output = Output(StringIO()) if output is None else output
+        self.colour_depth = colour_depth
+        self.terminal_width = terminal_width
+
+    @hybridmethod
+    def configure_output(self, output: Output) -> Output:
+        self.output.flush()
+        self.output = output
+        return self.output
+
+    @hybridmethod
+    def configure_terminal_width(self, terminal_width: int | None = None) -> int:
+        self.terminal_width = get_terminal_size().columns if terminal_width is None else terminal_width
+        self.terminal_position = None  # The terminal may have moved the cursor while reflowing
+        return self.terminal_width
+
+    @hybridmethod
+    def configure_colour_depth(self, colour_depth: ColourDepth) -> ColourDepth:
+        self.reset_attributes(flush=False)  # The terminal's current colours were chosen at the old depth
+        self.colour_depth = colour_depth
+        return self.colour_depth
+
+    @hybridmethod
+    def up(self, n: int = 1, flush: bool = True) -> Cursor | type[Cursor]:
         if not isinstance(n, int):
             raise NotImplementedError from None
-        sys.__stdout__.write(f"\033[{n}A")
-        sys.__stdout__.flush()
-        cls.position -= (0, n)
-        return cls
+        self.output.write(f"\033[{n}A", flush=flush)
+        self.position -= (0, n)
+        if self.terminal_position is not None:
+            self.terminal_position -= (0, n)
+        return self
 
-    @classmethod
-    def down(cls, n: int = 1) -> type[Cursor]:
+    @hybridmethod
+    def down(self, n: int = 1, flush: bool = True) -> Cursor | type[Cursor]:
         if not isinstance(n, int):
             raise NotImplementedError from None
-        sys.__stdout__.write(f"\033[{n}B")
-        sys.__stdout__.flush()
-        cls.position += (0, n)
-        return cls
+        self.output.write(f"\033[{n}B", flush=flush)
+        self.position += (0, n)
+        if self.terminal_position is not None:
+            self.terminal_position += (0, n)
+        return self
 
-    @classmethod
-    def left(cls, n: int = 1) -> type[Cursor]:
+    @hybridmethod
+    def left(self, n: int = 1, flush: bool = True) -> Cursor | type[Cursor]:
         if not isinstance(n, int):
             raise NotImplementedError from None
-        sys.__stdout__.write(f"\033[{n}D")
-        sys.__stdout__.flush()
-        cls.position -= (n, 0)
-        return cls
+        self.output.write(f"\033[{n}D", flush=flush)
+        self.position -= (n, 0)
+        if self.terminal_position is not None:
+            self.terminal_position -= (n, 0)
+        return self
 
-    @classmethod
-    def right(cls, n: int = 1) -> type[Cursor]:
+    @hybridmethod
+    def right(self, n: int = 1, flush: bool = True) -> Cursor | type[Cursor]:
         if not isinstance(n, int):
             raise NotImplementedError from None
-        sys.__stdout__.write(f"\033[{n}C")
-        sys.__stdout__.flush()
-        cls.position += (n, 0)
-        return cls
+        self.output.write(f"\033[{n}C", flush=flush)
+        self.position += (n, 0)
+        if self.terminal_position is not None:
+            self.terminal_position += (n, 0)
+        return self
 
-    @classmethod
-    def go_to(cls, coordinate: Coordinate | tuple[int, int]) -> type[Cursor]:
+    @hybridmethod
+    def go_to(self, coordinate: Coordinate | tuple[int, int], flush: bool = True) -> Cursor | type[Cursor]:
         if not isinstance(coordinate, (Coordinate, tuple)):
             raise NotImplementedError from None
         elif isinstance(coordinate, tuple) and tuple(map(type, coordinate)) != (int, int):
             raise NotImplementedError from None
-        coordinate = coordinate if isinstance(coordinate, Coordinate) else Coordinate(*coordinate)
-        sys.__stdout__.write(f"\033[{coordinate.y + 1};{coordinate.x + 1}H")
-        sys.__stdout__.flush()
-        cls.position = coordinate
-        return cls
-
-    @classmethod
-    def update_position_on_print(cls, character: str) -> None:
+        self.position = coordinate if isinstance(coordinate, Coordinate) else Coordinate(*coordinate)
+        self.sync(flush=flush)
+        return self
+
+    @hybridmethod
+    def movement(self, coordinate: Coordinate) -> str:
+        if self.terminal_position is None:
+            return self.absolute_movement(coordinate)
+        elif coordinate == self.terminal_position:
+            return ""
+        dx, dy = coordinate.x - self.terminal_position.x, coordinate.y - self.terminal_position.y
+        candidates = [self.absolute_movement(coordinate), self.vertical_movement(dy) + self.horizontal_movement(dx)]
+        if coordinate.x == 0:
+            candidates.append("\r\n" if dy == 1 else "\r" + self.vertical_movement(dy))
+        return min(candidates, key=len)
+
+    @staticmethod
+    def absolute_movement(coordinate: Coordinate) -> str:
+        if coordinate.x == 0:
+            return f"\033[{coordinate.y + 1}H" if coordinate.y else "\033[H"
+        return f"\033[{coordinate.y + 1};{coordinate.x + 1}H"
+
+    @staticmethod
+    def horizontal_movement(n: int) -> str:
+        if n == -1:
+            return "\b"
+        elif n < 0:
+            return f"\033[{-n}D"
+        return ("\033[C" if n == 1 else f"\033[{n}C") if n else ""
+
+    @staticmethod
+    def vertical_movement(n: int) -> str:
+        if n < 0:
+            return "\033[A" if n == -1 else f"\033[{-n}A"
+        return ("\033[B" if n == 1 else f"\033[{n}B") if n else ""
+
+    @hybridmethod
+    def sync(self, flush: bool = True) -> Cursor | type[Cursor]:
+        self.output.write(self.movement(self.position), flush=flush)
+        is_on_screen = self.terminal_width is None or self.position.x < self.terminal_width
+        self.terminal_position = self.position if is_on_screen else None  # Moves past the last column are clamped
+        return self
+
+    @hybridmethod
+    def write(self, text: SupportsString, flush: bool = True, attributes: SGR | None = None) -> Cursor | type[Cursor]:
+        self.sync(flush=False)
+        characters = text.text if isinstance(text, Text) else str(text)
+        self.set_attributes(SGR.of(text) if attributes is None else attributes, flush=False)
+        self.output.write(characters, flush=flush)
+        uncertain = False
+        for character in characters:
+            uncertain = uncertain or self.is_unpredictable(character)
+            self.update_position_on_print(character)
+        self.terminal_position = None if uncertain else self.position
+        return self
+
+    @hybridmethod
+    def is_unpredictable(self, character: str) -> bool:
+        if character in (Text.TAB, Text.FORM_FEED):
+            return True
+        elif character in Text.CONTROL_CHARACTERS:
+            return False
+        elif self.terminal_width is not None and self.position.x >= self.terminal_width - 1:
+            return True  # The terminal cursor stays on the last column instead of advancing
+        return ord(character) >= 0x1100 and east_asian_width(character) in "WF"  # Wide characters advance two columns
+
+    @hybridmethod
+    def set_attributes(self, attributes: SGR, flush: bool = True) -> Cursor | type[Cursor]:
+        self.output.write(self.attributes.transition(attributes, self.colour_depth), flush=flush)
+        self.attributes = attributes
+        return self
+
+    @hybridmethod
+    def reset_attributes(self, flush: bool = True) -> Cursor | type[Cursor]:
+        return self.set_attributes(DEFAULT_SGR, flush=flush)
+
+    @hybridmethod
+    def update_position_on_print(self, character: str) -> None:
         match character:
             case Text.ZERO_WIDTH:
                 pass
             case Text.BACKSPACE:
-                cls.position -= (1, 0)
+                self.position -= (1, 0)
             case Text.NEWLINE:
-                cls.position = Coordinate(0, cls.position.y + 1)
+                self.position = Coordinate(0, self.position.y + 1)
             case Text.TAB:
-                cls.position += (4, 0)
+                self.position += (4, 0)
             case Text.CARRIAGE_RETURN:
-                cls.position = Coordinate(0, cls.position.y)
+                self.position = Coordinate(0, self.position.y)
             case Text.FORM_FEED:
-                cls.position = Coordinate(cls.position.x + 1, cls.position.y + 1)
+                self.position = Coordinate(self.position.x + 1, self.position.y + 1)
             case _:
-                cls.position += (1, 0)
+                self.position = Coordinate(self.position.x + 1, self.position.y)
     
-    @classmethod
-    def show(cls) -> None:
-        sys.__stdout__.write("\033[?25h")
-        sys.__stdout__.flush()
-        cls.visible = True
+    @hybridmethod
+    def show(self, flush: bool = True) -> None:
+        self.output.write("\033[?25h", flush=flush)
+        self.visible = True
     
-    @classmethod
-    def hide(cls) -> None:
-        sys.__stdout__.write("\033[?25l")
-        sys.__stdout__.flush()
-        cls.visible = False
+    @hybridmethod
+    def hide(self, flush: bool = True) -> None:
+        self.output.write("\033[?25l", flush=flush)
+        self.visible = False
     
-    @classmethod
-    def clear_line(cls, before_cursor: bool = True, after_cursor: bool = True) -> None:
+    @hybridmethod
+    def clear_line(self, before_cursor: bool = True, after_cursor: bool = True, flush: bool = True) -> None:
         if not (before_cursor or after_cursor):
             return
         elif not before_cursor:
-            sys.__stdout__.write("\033[K")
+            self.output.write("\033[K", flush=flush)
         elif not after_cursor:
-            sys.__stdout__.write("\033[1K")
+            self.output.write("\033[1K", flush=flush)
         else:
-            sys.__stdout__.write("\033[2K")
-        sys.__stdout__.flush()
+            self.output.write("\033[2K", flush=flush)
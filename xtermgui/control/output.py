@@ -0,0 +1,49 @@
+from __future__ import annotations
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from threading import RLock, local
+from typing import Iterator, TextIO
+
+
+@dataclass(slots=True)
+class Output:
+    stream: TextIO = field(default_factory=lambda: sys.__stdout__)
+    buffer: list[str] = field(default_factory=list, init=False, repr=False)
+    lock: RLock = field(default_factory=RLock, init=False, repr=False)
+    state: local = field(default_factory=local, init=False, repr=False)  # Batching is per thread, the buffer is shared
+
+    @property
+    def batch_depth(self) -> int:
+        return getattr(self.state, "batch_depth", 0)
+
+    @property
+    def is_batching(self) -> bool:
+        return self.batch_depth > 0
+
+    def write(self, text: str, flush: bool = True) -> None:
+        if text:
+            with self.lock:
+                self.buffer.append(text)
+        if flush:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.is_batching:
+            return
+        with self.lock:  # Escape codes are built relative to what was written before - keep one ordered stream
+            if not self.buffer:
+                return
+            text = "".join(self.buffer)
+            self.buffer.clear()
+            self.stream.write(text)
+            self.stream.flush()
+
+    @contextmanager
+    def batch(self) -> Iterator[Output]:
+        self.state.batch_depth = self.batch_depth + 1
+        try:
+            yield self
+        finally:
+            self.state.batch_depth -= 1
+            self.flush()
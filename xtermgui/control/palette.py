@@ -0,0 +1,35 @@
+from __future__ import annotations
+from functools import lru_cache
+from .rgb import RGB
+
+
+PALETTE_16 = (
+    RGB(0, 0, 0), RGB(205, 0, 0), RGB(0, 205, 0), RGB(205, 205, 0),
+    RGB(0, 0, 238), RGB(205, 0, 205), RGB(0, 205, 205), RGB(229, 229, 229),
+    RGB(127, 127, 127), RGB(255, 0, 0), RGB(0, 255, 0), RGB(255, 255, 0),
+    RGB(92, 92, 255), RGB(255, 0, 255), RGB(0, 255, 255), RGB(255, 255, 255),
+)
+CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+CUBE_INDICES = tuple(0 if value < 48 else 1 if value < 115 else (value - 35) // 40 for value in range(256))
+PALETTE_256 = PALETTE_16 + tuple(
+    RGB(CUBE_LEVELS[red], CUBE_LEVELS[green], CUBE_LEVELS[blue])
+    for red in range(6) for green in range(6) for blue in range(6)
+) + tuple(RGB(8 + 10 * step, 8 + 10 * step, 8 + 10 * step) for step in range(24))
+
+
+def distance(first: tuple[int, int, int], second: tuple[int, int, int]) -> int:
+    return (first[0] - second[0]) ** 2 + (first[1] - second[1]) ** 2 + (first[2] - second[2]) ** 2
+
+
+@lru_cache(maxsize=4096)
+def nearest_256(rgb: RGB) -> int:
+    red, green, blue = CUBE_INDICES[rgb[0]], CUBE_INDICES[rgb[1]], CUBE_INDICES[rgb[2]]
+    cube = 16 + 36 * red + 6 * green + blue
+    step = min(max((sum(rgb) // 3 - 3) // 10, 0), 23)
+    grey = 232 + step
+    return min((cube, grey), key=lambda index: distance(rgb, PALETTE_256[index]))
+
+
+@lru_cache(maxsize=4096)
+def nearest_16(rgb: RGB) -> int:
+    return min(range(16), key=lambda index: distance(rgb, PALETTE_16[index]))
@@ -1,6 +1,5 @@
 from __future__ import annotations
 from typing import Iterable, NamedTuple
-from statistics import mean
 
 
 class RGB(NamedTuple):
@@ -14,9 +13,7 @@ class RGB(NamedTuple):
 
     @staticmethod
     def _validate_blend(other: ColourType) -> bool:
-        if not isinstance(other, (RGB, tuple)):
-            return False
-        return not (isinstance(other, tuple) or tuple(map(type, other)) == (int, int, int))
+        return isinstance(other, tuple) and tuple(map(type, other)) == (int, int, int)
 
     def additive_blend(self, other: ColourType) -> RGB:
         if not self._validate_blend(other):
@@ -31,7 +28,7 @@ class RGB(NamedTuple):
             raise NotImplementedError from None
         other = (other.red, other.green, other.blue) if isinstance(other, RGB) else other
         return RGB(*map(
-            lambda one, two: round(mean((one, two))), (self.red, self.green, self.blue), other
+            lambda one, two: round((one + two) / 2), (self.red, self.green, self.blue), other
         ))
 
     def linear_blend(self, other: ColourType, bias: float = 0.5) -> RGB:
@@ -0,0 +1,97 @@
+from __future__ import annotations
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import NamedTuple
+from .colour import Colour
+from .colours import Colours
+from .style import Style
+from .styles import Styles
+from .text import Text, escape_code_prefix
+from ..utils import SupportsString
+
+
+class Span(NamedTuple):
+    text: str
+    colour: Colour = Colours.F_DEFAULT.value
+    style: Style = Styles.NOT_STYLED.value
+
+    @property
+    def has_effects(self) -> bool:
+        return bool(self.colour) or bool(self.style)
+
+    def __str__(self) -> str:
+        if not (escape_code := escape_code_prefix(self.colour, self.style)):
+            return self.text
+        return f"{escape_code}{self.text}\033[0m"
+
+
+@dataclass(frozen=True, slots=True)
+class RichText:
+    spans: tuple[Span, ...] = ()
+    offsets: tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        spans = []
+        for span in self.spans:
+            if not span.text:
+                continue
+            elif spans and spans[-1].colour == span.colour and spans[-1].style == span.style:
+                spans[-1] = Span(spans[-1].text + span.text, span.colour, span.style)
+            else:
+                spans.append(span)
+        object.__setattr__(self, "spans", tuple(spans))
+        object.__setattr__(self, "offsets", tuple(accumulate((len(span.text) for span in spans), initial=0)))
+
+    @classmethod
+    def of(cls, *items: SupportsString) -> RichText:
+        spans = []
+        for item in items:
+            if isinstance(item, RichText):
+                spans.extend(item.spans)
+            elif isinstance(item, Text):
+                spans.append(Span(item.text, item.colour, item.style))
+            else:
+                spans.append(Span(str(item)))
+        return cls(tuple(spans))
+
+    @property
+    def text(self) -> str:
+        return "".join(span.text for span in self.spans)
+
+    @property
+    def has_effects(self) -> bool:
+        return any(span.has_effects for span in self.spans)
+
+    def __str__(self) -> str:
+        return "".join(map(str, self.spans))
+
+    def __len__(self) -> int:
+        return self.offsets[-1]
+
+    def __add__(self, other: SupportsString) -> RichText:
+        return RichText(self.spans + RichText.of(other).spans)
+
+    def __radd__(self, other: SupportsString) -> RichText:
+        return RichText(RichText.of(other).spans + self.spans)
+
+    def __getitem__(self, index: int | slice) -> Text | RichText:
+        if isinstance(index, slice):
+            return self.slice(*index.indices(len(self)))
+        elif not -len(self) <= index < len(self):
+            raise IndexError("RichText index out of range") from None
+        index %= len(self)
+        position = bisect_right(self.offsets, index) - 1
+        span = self.spans[position]
+        return Text(span.text[index - self.offsets[position]], colour=span.colour, style=span.style)
+
+    def slice(self, start: int, stop: int, step: int = 1) -> RichText:
+        if step != 1:
+            return RichText.of(*(self[index] for index in range(start, stop, step)))
+        spans = []
+        for position in range(bisect_right(self.offsets, start) - 1, len(self.spans)):
+            offset, span = self.offsets[position], self.spans[position]
+            if offset >= stop:
+                break
+            spans.append(Span(span.text[max(start - offset, 0):stop - offset], span.colour, span.style))
+        return RichText(tuple(spans))
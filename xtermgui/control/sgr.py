@@ -0,0 +1,94 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import ClassVar, Optional
+from .colour import Colour
+from .colour_depth import ColourDepth
+from .palette import nearest_16, nearest_256
+from .rgb import RGB
+from .style import Style
+from .styles import Styles
+from .text import Text
+from ..utils import SupportsString
+
+
+@dataclass(frozen=True, slots=True)
+class SGR:
+    STYLE_CODES: ClassVar[tuple[str, ...]] = ("1", "2", "3", "4", "8", "9")
+    STYLE_RESET_CODES: ClassVar[tuple[str, ...]] = ("22", "22", "23", "24", "28", "29")
+
+    foreground: Optional[RGB] = None
+    background: Optional[RGB] = None
+    style: Style = Styles.NOT_STYLED.value
+
+    @classmethod
+    def of(cls, text: SupportsString) -> SGR:
+        if not isinstance(text, Text):
+            return DEFAULT_SGR
+        return cls.of_effects(text.colour, text.style)
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def of_effects(cls, colour: Colour, style: Style) -> SGR:
+        if not colour and not style:
+            return DEFAULT_SGR
+        elif not colour:
+            return cls(style=style)
+        return cls(colour.foreground, colour.background, style)
+
+    @staticmethod
+    def style_flags(style: Style) -> tuple[bool, ...]:
+        return style.bold, style.dimmed, style.italic, style.underlined, style.hidden, style.crossed_out
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def colour_segment(rgb: RGB | None, foreground: bool, depth: ColourDepth = ColourDepth.TRUECOLOR) -> str:
+        if depth is ColourDepth.MONOCHROME:
+            return ""
+        elif rgb is None:
+            return "39" if foreground else "49"
+        elif depth is ColourDepth.PALETTE_256:
+            return f"{38 if foreground else 48};5;{nearest_256(rgb)}"
+        elif depth is ColourDepth.PALETTE_16:
+            index = nearest_16(rgb)
+            return str((30 if foreground else 40) + index if index < 8 else (90 if foreground else 100) + index - 8)
+        return f"{38 if foreground else 48};2;{rgb.red};{rgb.green};{rgb.blue}"
+
+    @property
+    def escape_code(self) -> str:
+        return self.escape_code_at(ColourDepth.TRUECOLOR)
+
+    def escape_code_at(self, depth: ColourDepth) -> str:
+        segments = ["0"]
+        if self.foreground is not None and (segment := self.colour_segment(self.foreground, True, depth)):
+            segments.append(segment)
+        if self.background is not None and (segment := self.colour_segment(self.background, False, depth)):
+            segments.append(segment)
+        segments.extend(code for code, flag in zip(self.__class__.STYLE_CODES, self.style_flags(self.style)) if flag)
+        return f"\033[{';'.join(segments)}m"
+
+    @lru_cache(maxsize=4096)
+    def transition(self, other: SGR, depth: ColourDepth = ColourDepth.TRUECOLOR) -> str:
+        if self == other:
+            return ""
+        segments = []
+        previous, current = self.style_flags(self.style), self.style_flags(other.style)
+        intensity_reset = (previous[0] and not current[0]) or (previous[1] and not current[1])
+        for index, (had, has) in enumerate(zip(previous, current)):
+            if had and not has and index > 1:
+                segments.append(self.__class__.STYLE_RESET_CODES[index])
+        if intensity_reset:
+            segments.append(self.__class__.STYLE_RESET_CODES[0])
+        for index, (had, has) in enumerate(zip(previous, current)):
+            if has and (not had or (intensity_reset and index < 2)):
+                segments.append(self.__class__.STYLE_CODES[index])
+        if (segment := self.colour_segment(other.foreground, True, depth)) != self.colour_segment(self.foreground, True, depth):
+            segments.append(segment)
+        if (segment := self.colour_segment(other.background, False, depth)) != self.colour_segment(self.background, False, depth):
+            segments.append(segment)
+        if not segments:
+            return ""
+        return min(f"\033[{';'.join(segments)}m", other.escape_code_at(depth), key=len)
+
+
+DEFAULT_SGR = SGR()
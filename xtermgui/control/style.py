@@ -15,6 +15,7 @@ class Style:
         "9": "CROSSED_OUT",
         "0": "NOT_STYLED"
     }
+    INTERNED: ClassVar[dict[tuple[bool, ...], Style]] = {}
     bold: bool = False
     dimmed: bool = False
     italic: bool = False
@@ -22,6 +23,31 @@ class Style:
     hidden: bool = False
     crossed_out: bool = False
 
+    def __new__(cls, bold: bool = False, dimmed: bool = False, italic: bool = False, underlined: bool = False, hidden: bool = False, crossed_out: bool = False) -> Style:
+        if (style := cls.INTERNED.get((bold, dimmed, italic, underlined, hidden, crossed_out))) is not None:
+            return style
+        return super().__new__(cls)
+
+    def __post_init__(self) -> None:
+        self.__class__.INTERNED.setdefault(self.flags, self)
+
+    @property
+    def flags(self) -> tuple[bool, ...]:
+        return self.bold, self.dimmed, self.italic, self.underlined, self.hidden, self.crossed_out
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        elif not isinstance(other, Style):
+            return NotImplemented
+        return self.flags == other.flags
+
+    def __hash__(self) -> int:
+        return hash(self.flags)
+
+    def __reduce__(self) -> tuple:
+        return self.__class__, self.flags
+
     @cached_property
     def styled(self) -> bool:
         return self.bold or self.dimmed or self.italic or self.underlined or self.hidden or self.crossed_out
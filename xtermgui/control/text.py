@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import Callable, ClassVar, Iterator
 from dataclasses import dataclass
+from functools import lru_cache
 from re import split
 from .colour import Colour
 from .colours import Colours
@@ -9,6 +10,12 @@ from .styles import Styles
 from ..utils import SupportsLessThan, SupportsString
 
 
+@lru_cache(maxsize=4096)
+def escape_code_prefix(colour: Colour, style: Style) -> str:
+    escape_code_segments = ";".join(effect.escape_code_segment for effect in (colour, style) if effect)
+    return f"\033[{escape_code_segments}m" if escape_code_segments else ""
+
+
 @dataclass(frozen=True, slots=True)
 class Text(str):
     ZERO_WIDTH: ClassVar[str] = '​'
@@ -17,6 +24,7 @@ class Text(str):
     TAB: ClassVar[str] = '\t'
     CARRIAGE_RETURN: ClassVar[str] = '\r'
     FORM_FEED: ClassVar[str] = '\f'
+    CONTROL_CHARACTERS: ClassVar[tuple[str, ...]] = (ZERO_WIDTH, BACKSPACE, NEWLINE, TAB, CARRIAGE_RETURN, FORM_FEED)
 
     text: SupportsString = ""
     colour: Colour = Colours.F_DEFAULT.value
@@ -29,14 +37,13 @@ class Text(str):
         return super(Text, cls).__new__(cls, text)
 
     def __str__(self) -> str:
-        if not self.has_effects:
+        if not (escape_code := escape_code_prefix(self.colour, self.style)):
             return self.text
-        return f"{self.escape_code}{self.text}\033[0m"
+        return f"{escape_code}{self.text}\033[0m"
 
     @property
     def escape_code(self) -> str:
-        escape_code_segments = ";".join(effect.escape_code_segment for effect in (self.colour, self.style) if effect)
-        return f"\033[{escape_code_segments}m" if escape_code_segments else ""
+        return escape_code_prefix(self.colour, self.style)
 
     @property
     def has_effects(self) -> bool:
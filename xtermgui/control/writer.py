@@ -0,0 +1,65 @@
+from __future__ import annotations
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from queue import Empty, SimpleQueue
+from threading import Thread, current_thread
+from typing import Any, Callable
+from .cursor import Cursor
+
+
+@dataclass(slots=True)
+class Writer:
+    max_batch: int = 256
+    commands: SimpleQueue[tuple[Future, Callable[..., Any], tuple, dict] | None] = field(default_factory=SimpleQueue, init=False, repr=False)
+    thread: Thread | None = field(default=None, init=False, repr=False)
+
+    @property
+    def is_running(self) -> bool:
+        return self.thread is not None
+
+    @property
+    def is_writer_thread(self) -> bool:
+        return current_thread() is self.thread
+
+    def start(self) -> None:
+        self.thread = Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        if self.thread is None:
+            return
+        self.commands.put(None)
+        if not self.is_writer_thread:
+            self.thread.join()
+        self.thread = None
+
+    def submit(self, command: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        future = Future()
+        if not self.is_running or self.is_writer_thread:
+            self.execute(future, command, args, kwargs)
+        else:
+            self.commands.put((future, command, args, kwargs))
+        return future
+
+    @staticmethod
+    def execute(future: Future, command: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+        try:
+            future.set_result(command(*args, **kwargs))
+        except BaseException as error:
+            future.set_exception(error)
+
+    def run(self) -> None:
+        is_stopping = False
+        while not is_stopping:
+            batch = [self.commands.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self.commands.get_nowait())
+                except Empty:
+                    break
+            with Cursor.output.batch():
+                for command in batch:
+                    if command is None:
+                        is_stopping = True
+                        continue
+                    self.execute(*command)
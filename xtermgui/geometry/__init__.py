@@ -1,2 +1,5 @@
 from .coordinate import Coordinate
+from .mask import Mask
 from .region import Region
+from .rectangle import Rectangle
+from .spatial_index import SpatialIndex
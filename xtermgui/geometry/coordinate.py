@@ -1,33 +1,74 @@
 from __future__ import annotations
-from typing import Iterator
-from dataclasses import dataclass, field
+from typing import ClassVar, Iterator
+from dataclasses import dataclass
 from math import sqrt
 
 
-@dataclass(frozen=True, slots=True, order=True)
+@dataclass(frozen=True, slots=True, init=False)
 class Coordinate:
-    sort_index: float = field(init=False, repr=False)
+    INTERNED_WIDTH: ClassVar[int] = 512
+    INTERNED_HEIGHT: ClassVar[int] = 256
+    INTERNED: ClassVar[list[list[Coordinate | None] | None]] = [None] * INTERNED_HEIGHT
     x: int
     y: int
 
-    def __post_init__(self) -> None:
-        object.__setattr__(self, "sort_index", abs(self))
+    def __new__(cls, x: int, y: int) -> Coordinate:
+        if cls is not Coordinate or type(x) is not int or type(y) is not int or not (
+                0 <= x < cls.INTERNED_WIDTH and 0 <= y < cls.INTERNED_HEIGHT):
+            return cls.create(x, y)
+        if (row := cls.INTERNED[y]) is None:
+            row = cls.INTERNED[y] = [None] * cls.INTERNED_WIDTH
+        if (coordinate := row[x]) is None:
+            coordinate = row[x] = cls.create(x, y)
+        return coordinate
+
+    @classmethod
+    def create(cls, x: int, y: int) -> Coordinate:
+        coordinate = object.__new__(cls)
+        object.__setattr__(coordinate, "x", x)
+        object.__setattr__(coordinate, "y", y)
+        return coordinate
+
+    def __reduce__(self) -> tuple:
+        return self.__class__, (self.x, self.y)
+
+    @property
+    def sort_key(self) -> tuple[float, int, int]:
+        return abs(self), self.x, self.y
+
+    def __lt__(self, other: Coordinate) -> bool:
+        if not isinstance(other, Coordinate):
+            return NotImplemented
+        return self.sort_key < other.sort_key
+
+    def __le__(self, other: Coordinate) -> bool:
+        if not isinstance(other, Coordinate):
+            return NotImplemented
+        return self.sort_key <= other.sort_key
+
+    def __gt__(self, other: Coordinate) -> bool:
+        if not isinstance(other, Coordinate):
+            return NotImplemented
+        return self.sort_key > other.sort_key
+
+    def __ge__(self, other: Coordinate) -> bool:
+        if not isinstance(other, Coordinate):
+            return NotImplemented
+        return self.sort_key >= other.sort_key
 
     def __add__(self, other: Coordinate | tuple[int, int]) -> Coordinate:
-        if not isinstance(other, (Coordinate, tuple)):
-            raise NotImplementedError from None
-        elif isinstance(other, tuple) and tuple(map(type, other)) != (int, int):
-            raise NotImplementedError from None
-        x, y = (other.x, other.y) if isinstance(other, Coordinate) else (other[0], other[1])
-        return Coordinate(self.x + x, self.y + y)
+        if isinstance(other, Coordinate):
+            return Coordinate(self.x + other.x, self.y + other.y)
+        elif type(other) is tuple and len(other) == 2 and type(other[0]) is int and type(other[1]) is int:
+            return Coordinate(self.x + other[0], self.y + other[1])
+        raise NotImplementedError from None
 
     def __sub__(self, other: Coordinate | tuple[int, int]) -> Coordinate:
-        if not isinstance(other, (Coordinate, tuple)):
-            raise NotImplementedError from None
-        elif isinstance(other, tuple) and tuple(map(type, other)) != (int, int):
-            raise NotImplementedError from None
-        x, y = (other.x, other.y) if isinstance(other, Coordinate) else (other[0], other[1])
-        return Coordinate(self.x - x, self.y - y)
+        if isinstance(other, Coordinate):
+            return Coordinate(self.x - other.x, self.y - other.y)
+        elif type(other) is tuple and len(other) == 2 and type(other[0]) is int and type(other[1]) is int:
+            return Coordinate(self.x - other[0], self.y - other[1])
+        raise NotImplementedError from None
 
     def __mul__(self, scalar: float) -> Coordinate:
         if not isinstance(scalar, (int, float)):
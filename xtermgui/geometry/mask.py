@@ -0,0 +1,75 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Iterator
+from .coordinate import Coordinate
+
+
+@dataclass(frozen=True, slots=True)
+class Mask:
+    left: int
+    top: int
+    rows: tuple[int, ...]
+    right: int = field(init=False, repr=False)
+    bottom: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "right", self.left + max((row.bit_length() for row in self.rows), default=0) - 1)
+        object.__setattr__(self, "bottom", self.top + len(self.rows) - 1)
+
+    @classmethod
+    def normalized(cls, left: int, top: int, rows: list[int]) -> Mask:
+        while rows and not rows[-1]:
+            rows.pop()
+        start = next((index for index, row in enumerate(rows) if row), len(rows))
+        rows = rows[start:]
+        shift = min(((row & -row).bit_length() - 1 for row in rows if row), default=0)
+        return cls(left + shift, top + start, tuple(row >> shift for row in rows))
+
+    def row_at(self, y: int, left: int) -> int:
+        if not self.top <= y <= self.bottom:
+            return 0
+        row = self.rows[y - self.top]
+        return row << (self.left - left) if self.left >= left else row >> (left - self.left)
+
+    def __contains__(self, coordinate: Coordinate) -> bool:
+        x, y = coordinate.x - self.left, coordinate.y - self.top
+        return 0 <= y < len(self.rows) and x >= 0 and bool(self.rows[y] >> x & 1)
+
+    def __or__(self, other: Mask) -> Mask:
+        if not isinstance(other, Mask):
+            return NotImplemented
+        left, top = min(self.left, other.left), min(self.top, other.top)
+        bottom = max(self.bottom, other.bottom)
+        return self.normalized(left, top, [self.row_at(y, left) | other.row_at(y, left) for y in range(top, bottom + 1)])
+
+    def __and__(self, other: Mask) -> Mask:
+        if not isinstance(other, Mask):
+            return NotImplemented
+        left, top = min(self.left, other.left), max(self.top, other.top)
+        bottom = min(self.bottom, other.bottom)
+        return self.normalized(left, top, [self.row_at(y, left) & other.row_at(y, left) for y in range(top, bottom + 1)])
+
+    def __sub__(self, other: Mask) -> Mask:
+        if not isinstance(other, Mask):
+            return NotImplemented
+        return self.normalized(self.left, self.top, [
+            self.row_at(y, self.left) & ~other.row_at(y, self.left) for y in range(self.top, self.bottom + 1)
+        ])
+
+    def __len__(self) -> int:
+        return sum(row.bit_count() for row in self.rows)
+
+    def __bool__(self) -> bool:
+        return any(self.rows)
+
+    def rasterize(self) -> Mask:
+        return self
+
+    def coordinates(self) -> Iterator[Coordinate]:
+        for y, row in enumerate(self.rows, start=self.top):
+            x = self.left
+            while row:
+                if row & 1:
+                    yield Coordinate(x, y)
+                row >>= 1
+                x += 1
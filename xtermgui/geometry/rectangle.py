@@ -0,0 +1,45 @@
+from __future__ import annotations
+from typing import Iterator
+from dataclasses import dataclass
+from .coordinate import Coordinate
+from .mask import Mask
+from .region import Region
+
+
+@dataclass(frozen=True, slots=True, init=False)
+class Rectangle(Region):
+    def __init__(self, top_left: Coordinate, bottom_right: Coordinate):
+        if bottom_right.x <= top_left.x or bottom_right.y <= top_left.y:
+            raise ValueError(f"Rectangle cannot be formed from {top_left = } and {bottom_right = }.") from None
+        super(Rectangle, self).__init__(
+            top_left, Coordinate(bottom_right.x, top_left.y), bottom_right, Coordinate(top_left.x, bottom_right.y)
+        )
+
+    @property
+    def top_left(self) -> Coordinate:
+        return Coordinate(self.left, self.top)
+
+    @property
+    def bottom_right(self) -> Coordinate:
+        return Coordinate(self.right, self.bottom)
+
+    @property
+    def width(self) -> int:
+        return self.right - self.left
+
+    @property
+    def height(self) -> int:
+        return self.bottom - self.top
+
+    def __contains__(self, coordinate: Coordinate) -> bool:
+        return self.left <= coordinate.x < self.right and self.top <= coordinate.y < self.bottom
+
+    def rasterize(self) -> Mask:
+        if self.mask is None:
+            object.__setattr__(self, "mask", Mask(self.left, self.top, ((1 << self.width) - 1,) * self.height))
+        return self.mask
+
+    def coordinates(self) -> Iterator[Coordinate]:
+        for y in range(self.top, self.bottom):
+            for x in range(self.left, self.right):
+                yield Coordinate(x, y)
@@ -1,24 +1,67 @@
+from __future__ import annotations
+from typing import Iterator
 from dataclasses import dataclass, field
 from .coordinate import Coordinate
+from .mask import Mask
 
 
 @dataclass(frozen=True, slots=True, init=False)
 class Region:
     vertices: tuple[Coordinate] = field(init=False)
     n_vertices: int = field(init=False)
+    left: int = field(init=False, repr=False)
+    top: int = field(init=False, repr=False)
+    right: int = field(init=False, repr=False)
+    bottom: int = field(init=False, repr=False)
+    edges: tuple[tuple[int, int, int, float], ...] = field(init=False, repr=False, compare=False)
+    mask: Mask | None = field(init=False, repr=False, compare=False)
 
     def __init__(self, *vertices: Coordinate):
         object.__setattr__(self, "n_vertices", len(vertices))
         if self.n_vertices < 3:
             raise ValueError("Region cannot be formed from less than 3 coordinates.") from None
         object.__setattr__(self, "vertices", vertices)
+        xs, ys = [vertex.x for vertex in vertices], [vertex.y for vertex in vertices]
+        object.__setattr__(self, "left", min(xs))
+        object.__setattr__(self, "top", min(ys))
+        object.__setattr__(self, "right", max(xs))
+        object.__setattr__(self, "bottom", max(ys))
+        object.__setattr__(self, "edges", tuple(
+            (end.x, end.y, start.y, (start.x - end.x) / (start.y - end.y) if start.y != end.y else 0.0)
+            for end, start in zip(vertices, (vertices[-1], *vertices[:-1]))
+        ))
+        object.__setattr__(self, "mask", None)
 
     def __contains__(self, coordinate: Coordinate):  # https://wrfranklin.org/Research/Short_Notes/pnpoly.html
+        x, y = coordinate.x, coordinate.y
+        if not (self.left <= x <= self.right and self.top <= y <= self.bottom):
+            return False
+        elif self.mask is not None:
+            return coordinate in self.mask
         contains = False
-        for end, start in zip(self.vertices, (self.vertices[-1], *self.vertices[:-1])):
-            if (
-                    ((end.y > coordinate.y) != (start.y > coordinate.y)) and
-                    (coordinate.x < (start.x - end.x) * (coordinate.y - end.y) / (start.y - end.y) + end.x)
-            ):
+        for end_x, end_y, start_y, slope in self.edges:
+            if ((end_y > y) != (start_y > y)) and (x < slope * (y - end_y) + end_x):
                 contains = not contains
         return contains
+
+    def rasterize(self) -> Mask:
+        if self.mask is None:
+            width = self.right - self.left + 1
+            rows = [
+                sum(1 << x for x in range(width) if Coordinate(self.left + x, y) in self)
+                for y in range(self.top, self.bottom + 1)
+            ]
+            object.__setattr__(self, "mask", Mask.normalized(self.left, self.top, rows))
+        return self.mask
+
+    def coordinates(self) -> Iterator[Coordinate]:
+        return self.rasterize().coordinates()
+
+    def __or__(self, other: Region | Mask) -> Mask:
+        return self.rasterize() | other.rasterize()
+
+    def __and__(self, other: Region | Mask) -> Mask:
+        return self.rasterize() & other.rasterize()
+
+    def __sub__(self, other: Region | Mask) -> Mask:
+        return self.rasterize() - other.rasterize()
@@ -0,0 +1,29 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Generic, Iterator, TypeVar
+from .coordinate import Coordinate
+from .mask import Mask
+from .region import Region
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class SpatialIndex(Generic[T]):
+    cell_width: int = 16
+    cell_height: int = 8
+    buckets: dict[tuple[int, int], list[tuple[Region | Mask, T]]] = field(default_factory=dict, init=False, repr=False)
+
+    def add(self, region: Region | Mask, item: T) -> None:
+        for row in range(region.top // self.cell_height, region.bottom // self.cell_height + 1):
+            for column in range(region.left // self.cell_width, region.right // self.cell_width + 1):
+                self.buckets.setdefault((column, row), []).append((region, item))
+
+    def query(self, coordinate: Coordinate) -> Iterator[T]:
+        x, y = coordinate.x, coordinate.y
+        for region, item in self.buckets.get((x // self.cell_width, y // self.cell_height), ()):
+            if region.left <= x <= region.right and region.top <= y <= region.bottom and coordinate in region:
+                yield item
+
+    def __bool__(self) -> bool:
+        return bool(self.buckets)
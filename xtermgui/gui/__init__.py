@@ -1,3 +1,7 @@
 from .gui import GUI
+from .grid import Grid
+from .surface import Surface
+from .frame_scheduler import FrameScheduler
+from .serialized import serialized
 from .keyboard_interaction import KeyboardInteraction
 from .mouse_interaction import MouseInteraction
@@ -0,0 +1,47 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from heapq import merge
+from typing import Iterator
+from .keyboard_interaction import KeyboardInteraction
+from .mouse_interaction import MouseInteraction
+from ..geometry import SpatialIndex
+from ..input import KeyboardEvent, MouseEvent
+
+Interaction = KeyboardInteraction | MouseInteraction
+
+
+@dataclass(slots=True)
+class DispatchTable:
+    named: dict[str, list[tuple[int, Interaction]]] = field(default_factory=dict)
+    any_keyboard: list[tuple[int, Interaction]] = field(default_factory=list)
+    any_mouse: list[tuple[int, Interaction]] = field(default_factory=list)
+    predicates: list[tuple[int, Interaction]] = field(default_factory=list)
+    regions: SpatialIndex[MouseInteraction] = field(default_factory=SpatialIndex)
+    size: int = field(default=0, init=False, repr=False)
+
+    def add(self, interaction: Interaction) -> None:
+        entry = (self.size, interaction)
+        self.size += 1
+        if isinstance(interaction, MouseInteraction) and interaction.region is not None:
+            self.regions.add(interaction.region, interaction)
+        event = interaction.event
+        if event.name == KeyboardEvent.ANY:
+            self.any_keyboard.append(entry)
+        elif event.name == MouseEvent.ANY:
+            self.any_mouse.append(entry)
+        elif event.matches_name:
+            self.named.setdefault(event.name, []).append(entry)
+        else:
+            self.predicates.append(entry)
+
+    def candidates(self, event: KeyboardEvent | MouseEvent) -> Iterator[Interaction]:
+        wildcards = self.any_mouse if isinstance(event, MouseEvent) else self.any_keyboard
+        buckets = [bucket for bucket in (self.named.get(event.name), wildcards, self.predicates) if bucket]
+        entries = buckets[0] if len(buckets) == 1 else merge(*buckets, key=lambda entry: entry[0])
+        if not isinstance(event, MouseEvent) or not self.regions:
+            return (interaction for _, interaction in entries)
+        hits = {id(interaction) for interaction in self.regions.query(event.coordinate)}
+        return (
+            interaction for _, interaction in entries
+            if not isinstance(interaction, MouseInteraction) or interaction.region is None or id(interaction) in hits
+        )
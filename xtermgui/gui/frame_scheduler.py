@@ -0,0 +1,56 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from threading import Event as ThreadingEvent, Thread
+from time import monotonic
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .gui import GUI
+
+
+@dataclass(slots=True)
+class FrameScheduler:
+    gui: GUI
+    fps: float = 30
+    min_fps: float = 2
+    interval: float = field(init=False)
+    stopped: ThreadingEvent = field(default_factory=ThreadingEvent, init=False, repr=False)
+    thread: Thread | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if not 0 < self.min_fps <= self.fps:
+            raise ValueError("The frame rate must be positive, and at least the minimum frame rate") from None
+        self.interval = self.target_interval
+
+    @property
+    def target_interval(self) -> float:
+        return 1 / self.fps
+
+    @property
+    def max_interval(self) -> float:
+        return 1 / self.min_fps
+
+    def start(self) -> None:
+        self.stopped.clear()
+        self.thread = Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            self.tick()
+
+    def tick(self) -> None:
+        start = monotonic()
+        self.gui.submit(self.gui.commit).result()
+        self.adapt(monotonic() - start)
+
+    def adapt(self, elapsed: float) -> None:
+        if elapsed > self.interval / 2:  # The terminal is falling behind - back off
+            self.interval = min(self.interval * 2, self.max_interval)
+        else:
+            self.interval = max(self.interval * 0.75, self.target_interval)
@@ -0,0 +1,260 @@
+from __future__ import annotations
+from array import array
+from collections.abc import MutableMapping
+from dataclasses import dataclass, field
+from typing import ClassVar, Iterator
+from ..control import Colour, SGR, Style, Text
+from ..control.sgr import DEFAULT_SGR
+from ..geometry import Coordinate, Rectangle
+from ..utils import SupportsString
+
+
+@dataclass(slots=True, eq=False)
+class Grid(MutableMapping):
+    MAX_EFFECTS: ClassVar[int] = 1024
+    MIN_DENSE_CELLS: ClassVar[int] = 1 << 16
+    MAX_SPARSITY: ClassVar[int] = 8
+
+    width: int = 0
+    height: int = 0
+    codepoints: array = field(init=False, repr=False)
+    attributes: array = field(init=False, repr=False)
+    count: int = field(default=0, init=False, repr=False)
+    row_counts: array = field(init=False, repr=False)
+    column_counts: array = field(init=False, repr=False)
+    right: int = field(default=-1, init=False, repr=False)
+    bottom: int = field(default=-1, init=False, repr=False)
+    dirty: dict[int, tuple[int, int]] = field(default_factory=dict, init=False, repr=False)
+    sparse: dict[Coordinate, tuple[int, int]] = field(default_factory=dict, init=False, repr=False)
+    effects: list[tuple[Colour, Style] | None] = field(default_factory=lambda: [None], init=False, repr=False)
+    effects_indices: dict[tuple[Colour, Style], int] = field(default_factory=dict, init=False, repr=False)
+    sgrs: list[SGR] = field(default_factory=lambda: [DEFAULT_SGR], init=False, repr=False)
+    effects_limit: int = field(default=MAX_EFFECTS, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.codepoints = array("I", bytes(4 * self.width * self.height))
+        self.attributes = array("I", bytes(4 * self.width * self.height))
+        self.row_counts = array("I", bytes(4 * self.height))
+        self.column_counts = array("I", bytes(4 * self.width))
+
+    def attribute_index(self, character: SupportsString) -> int:
+        if not isinstance(character, Text):
+            return 0
+        return self.effects_index(character.colour, character.style)
+
+    def effects_index(self, colour: Colour, style: Style) -> int:
+        if not colour and not style:
+            return 0
+        key = (colour, style)
+        if (index := self.effects_indices.get(key)) is None:
+            if len(self.effects) >= self.effects_limit:
+                self.compact()
+            index = self.effects_indices[key] = len(self.effects)
+            self.effects.append(key)
+            self.sgrs.append(SGR.of_effects(colour, style))
+        return index
+
+    def attribute_from(self, source: Grid, attribute: int) -> int:
+        return self.effects_index(*source.effects[attribute]) if attribute else 0
+
+    def compact(self) -> None:
+        used = sorted(set(self.attributes).union(attribute for _, attribute in self.sparse.values()) - {0})
+        remap = dict(zip(used, range(1, len(used) + 1)))
+        remap[0] = 0
+        self.attributes = array("I", map(remap.__getitem__, self.attributes))
+        self.sparse = {at: (codepoint, remap[attribute]) for at, (codepoint, attribute) in self.sparse.items()}
+        self.effects = [None] + [self.effects[index] for index in used]
+        self.sgrs = [DEFAULT_SGR] + [self.sgrs[index] for index in used]
+        self.effects_indices = {key: index for index, key in enumerate(self.effects) if index}
+        self.effects_limit = max(self.__class__.MAX_EFFECTS, 2 * len(self.effects))  # Amortize the scan over many new effects
+
+    def character(self, codepoint: int, attribute: int) -> SupportsString:
+        if not attribute:
+            return chr(codepoint)
+        colour, style = self.effects[attribute]
+        return Text(chr(codepoint), colour=colour, style=style)
+
+    def index(self, at: Coordinate) -> int | None:
+        if 0 <= at.x < self.width and 0 <= at.y < self.height:
+            return at.y * self.width + at.x
+        return None
+
+    def resize(self, width: int, height: int) -> None:
+        codepoints = array("I", bytes(4 * width * height))
+        attributes = array("I", bytes(4 * width * height))
+        columns = min(width, self.width)
+        for y in range(min(height, self.height)):
+            source, destination = y * self.width, y * width
+            codepoints[destination:destination + columns] = self.codepoints[source:source + columns]
+            attributes[destination:destination + columns] = self.attributes[source:source + columns]
+        for at in [at for at in self.sparse if at.x < width and at.y < height]:
+            codepoints[at.y * width + at.x], attributes[at.y * width + at.x] = self.sparse.pop(at)
+        self.width, self.height = width, height
+        self.codepoints, self.attributes = codepoints, attributes
+        self.count = width * height - codepoints.count(0) + len(self.sparse)
+        self.row_counts = array("I", (width - codepoints[y * width:(y + 1) * width].count(0) for y in range(height)))
+        self.column_counts = array("I", (height - codepoints[x::width].count(0) for x in range(width)))
+        self.right, self.bottom = width - 1, height - 1
+        self.update_extent()
+
+    def grow(self, at: Coordinate) -> bool:
+        limit = max(self.__class__.MIN_DENSE_CELLS, self.__class__.MAX_SPARSITY * (self.count + 1))
+        width = self.width if at.x < self.width else max(at.x + 1, 2 * self.width)
+        height = self.height if at.y < self.height else max(at.y + 1, 2 * self.height)
+        if width * height > limit:
+            width, height = max(at.x + 1, self.width), max(at.y + 1, self.height)
+            if width * height > limit:  # A far outlier - keep it sparse rather than allocating a mostly empty block
+                return False
+        self.resize(width, height)
+        return True
+
+    def update_extent(self) -> None:
+        right, bottom = min(self.right, self.width - 1), min(self.bottom, self.height - 1)
+        while right >= 0 and not self.column_counts[right]:
+            right -= 1
+        while bottom >= 0 and not self.row_counts[bottom]:
+            bottom -= 1
+        self.right = max(right, max((at.x for at in self.sparse), default=-1))
+        self.bottom = max(bottom, max((at.y for at in self.sparse), default=-1))
+
+    def get_size(self) -> Coordinate:
+        return Coordinate(max(self.right, 0), max(self.bottom, 0))
+
+    def mark_dirty(self, at: Coordinate) -> None:
+        start, end = self.dirty.get(at.y, (at.x, at.x + 1))
+        self.dirty[at.y] = min(start, at.x), max(end, at.x + 1)
+
+    def dirty_rectangles(self) -> list[Rectangle]:
+        rectangles = []
+        for y in sorted(self.dirty):
+            start, end = self.dirty[y]
+            if rectangles and rectangles[-1].bottom == y and (rectangles[-1].left, rectangles[-1].right) == (start, end):
+                rectangles[-1] = Rectangle(rectangles[-1].top_left, Coordinate(end, y + 1))
+            else:
+                rectangles.append(Rectangle(Coordinate(start, y), Coordinate(end, y + 1)))
+        return rectangles
+
+    def reset_dirty(self) -> None:
+        self.dirty = {}
+
+    def occupy(self, x: int, y: int) -> None:
+        self.count += 1
+        self.row_counts[y] += 1
+        self.column_counts[x] += 1
+        self.right, self.bottom = max(self.right, x), max(self.bottom, y)
+
+    def vacate(self, x: int, y: int) -> None:
+        self.count -= 1
+        self.row_counts[y] -= 1
+        self.column_counts[x] -= 1
+        if (x == self.right and not self.column_counts[x]) or (y == self.bottom and not self.row_counts[y]):
+            self.update_extent()
+
+    def cell_at(self, at: Coordinate) -> tuple[int, int]:
+        if (index := self.index(at)) is None:
+            return self.sparse.get(at, (0, 0))
+        return self.codepoints[index], self.attributes[index]
+
+    def row(self, y: int, start: int = 0, end: int | None = None) -> list[SupportsString | None]:
+        end = self.width if end is None else end
+        if not 0 <= y < self.height:
+            cells = [None] * max(end - start, 0)
+        else:
+            offset = y * self.width
+            stop = offset + min(end, self.width)
+            cells = [
+                self.character(codepoint, attribute) if codepoint else None for codepoint, attribute in
+                zip(self.codepoints[offset + start:stop], self.attributes[offset + start:stop])
+            ] + [None] * max(end - max(start, self.width), 0)
+        for at, (codepoint, attribute) in self.sparse.items():
+            if at.y == y and start <= at.x < end:
+                cells[at.x - start] = self.character(codepoint, attribute)
+        return cells
+
+    def region(self, rectangle: Rectangle) -> list[list[SupportsString | None]]:
+        return [self.row(y, rectangle.left, rectangle.right) for y in range(rectangle.top, rectangle.bottom)]
+
+    def copy(self) -> Grid:
+        grid = Grid()
+        grid.width, grid.height, grid.count = self.width, self.height, self.count
+        grid.codepoints, grid.attributes = array("I", self.codepoints), array("I", self.attributes)
+        grid.row_counts, grid.column_counts = array("I", self.row_counts), array("I", self.column_counts)
+        grid.right, grid.bottom, grid.dirty, grid.sparse = self.right, self.bottom, dict(self.dirty), dict(self.sparse)
+        grid.effects, grid.effects_indices, grid.sgrs = list(self.effects), dict(self.effects_indices), list(self.sgrs)
+        grid.effects_limit = self.effects_limit
+        return grid
+
+    def __copy__(self) -> Grid:
+        return self.copy()
+
+    @classmethod
+    def from_cells(cls, width: int, height: int, cells: list[tuple[Coordinate, SupportsString]]) -> Grid:
+        grid = cls(width, height)
+        for at, character in cells:
+            grid[at] = character
+        grid.reset_dirty()
+        return grid
+
+    def __reduce__(self) -> tuple:
+        return self.__class__.from_cells, (self.width, self.height, list(self.items()))  # Attribute indices are process-local
+
+    def __getitem__(self, at: Coordinate) -> SupportsString:
+        if not (cell := self.cell_at(at))[0]:
+            raise KeyError(at) from None
+        return self.character(*cell)
+
+    def __setitem__(self, at: Coordinate, character: SupportsString) -> None:
+        if not isinstance(character, str) or len(character) != 1:
+            raise ValueError(f"Cannot store {character = } in a single cell") from None
+        self.put(at, character.text if isinstance(character, Text) else character, self.attribute_index(character))
+
+    def put(self, at: Coordinate, character: str, attribute: int) -> None:
+        if (index := self.index(at)) is None:
+            if at.x < 0 or at.y < 0:
+                raise ValueError(f"Cannot store a character at {at = }") from None
+            elif not self.grow(at):
+                if at not in self.sparse:
+                    self.count += 1
+                    self.right, self.bottom = max(self.right, at.x), max(self.bottom, at.y)
+                self.sparse[at] = ord(character), attribute
+                self.mark_dirty(at)
+                return
+            index = self.index(at)
+        if not self.codepoints[index]:
+            self.occupy(at.x, at.y)
+        self.codepoints[index] = ord(character)
+        self.attributes[index] = attribute
+        self.mark_dirty(at)
+
+    def __delitem__(self, at: Coordinate) -> None:
+        if (index := self.index(at)) is None and at in self.sparse:
+            del self.sparse[at]
+            self.count -= 1
+            self.update_extent()
+            self.mark_dirty(at)
+            return
+        elif index is None or not self.codepoints[index]:
+            raise KeyError(at) from None
+        self.codepoints[index] = self.attributes[index] = 0
+        self.vacate(at.x, at.y)
+        self.mark_dirty(at)
+
+    def get(self, at: Coordinate, default: SupportsString | None = None) -> SupportsString | None:
+        if not (cell := self.cell_at(at))[0]:
+            return default
+        return self.character(*cell)
+
+    def __contains__(self, at: object) -> bool:
+        return isinstance(at, Coordinate) and self.cell_at(at)[0] != 0
+
+    def __iter__(self) -> Iterator[Coordinate]:
+        width = self.width
+        for y, count in enumerate(self.row_counts):
+            if count:
+                for x, codepoint in enumerate(self.codepoints[y * width:(y + 1) * width]):
+                    if codepoint:
+                        yield Coordinate(x, y)
+        yield from list(self.sparse)
+
+    def __len__(self) -> int:
+        return self.count
@@ -1,14 +1,21 @@
 from __future__ import annotations
-from contextlib import contextmanager
+from asyncio import AbstractEventLoop, CancelledError, Future as AsyncFuture, Queue, Task, TimeoutError as AsyncTimeoutError, create_task, ensure_future, gather, get_running_loop, wait_for, wrap_future
+from concurrent.futures import Future
+from contextlib import asynccontextmanager, contextmanager, suppress
 from dataclasses import dataclass, field
-from inspect import getmembers
-from typing import Iterator, ClassVar
+from inspect import getmembers, isawaitable, iscoroutinefunction
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, ClassVar, Mapping
 from os import system
+from threading import Event as ThreadingEvent, RLock
 from .keyboard_interaction import KeyboardInteraction
 from .mouse_interaction import MouseInteraction
-from ..geometry import Coordinate
-from ..control import Cursor, Text
-from ..input import read_console, console_inputs, Events, KeyboardEvent
+from .dispatch_table import DispatchTable
+from .frame_scheduler import FrameScheduler
+from .serialized import serialized
+from .grid import Grid
+from ..geometry import Coordinate, Mask, Rectangle, Region
+from ..control import Colour, Cursor, RGB, RichText, Span, Text, Writer, blending
+from ..input import read_events, console_inputs, AsyncEventReader, Event, EventQueue, Events, KeyboardEvent, MouseEvent
 from ..utils import KillableThread, SupportsString
 
 
@@ -16,35 +23,192 @@ from ..utils import KillableThread, SupportsString
 class GUI:
     ERASE_CHARACTER: ClassVar[str] = ' '
     is_running: bool = field(default=False, init=False)
-    content: dict[Coordinate, SupportsString] = field(compare=False, init=False, default_factory=dict, repr=False)
+    content: Grid = field(compare=False, init=False, default_factory=Grid, repr=False)
+    screen: Grid = field(compare=False, init=False, default_factory=Grid, repr=False)
+    frame_depth: int = field(default=0, init=False, repr=False)
+    frame_scheduler: FrameScheduler | None = field(default=None, init=False, repr=False)
+    lock: RLock = field(default_factory=RLock, init=False, repr=False)
+    writer: Writer = field(default_factory=Writer, init=False, repr=False)
     interactions: list[KeyboardInteraction | MouseInteraction] = field(default_factory=list, init=False)
+    dispatch_table: DispatchTable = field(default_factory=DispatchTable, init=False, repr=False)
+    event_queue: EventQueue = field(default_factory=EventQueue, kw_only=True, repr=False)
+    event_reader: AsyncEventReader | None = field(default=None, init=False, repr=False)
+    event_subscribers: list[Queue[KeyboardEvent | MouseEvent | None]] = field(default_factory=list, init=False, repr=False)
+    consequence_tasks: set[Task] = field(default_factory=set, init=False, repr=False)
     input_buffer: str = field(default="", init=False, repr=False)
     is_input_mode: bool = field(default=False, init=False, repr=False)
     input_cursor_position_stamp: Coordinate | None = field(default=None, init=False, repr=False)
     input_echo: SupportsString = field(default=None, init=False, repr=False)
+    input_cancel_event: Event | None = field(default=None, init=False, repr=False)
+    input_echo_positions: list[Coordinate] = field(default_factory=list, init=False, repr=False)
+    input_submitted: ThreadingEvent = field(default_factory=ThreadingEvent, init=False, repr=False)
+    is_input_cancelled: bool = field(default=False, init=False, repr=False)
+    input_waiter: tuple[AbstractEventLoop, AsyncFuture[None]] | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
-        self.interactions = [interaction for interaction in self.get_interactions()]
+        self.interactions = []
+        for interaction in self.get_interactions():
+            self.add_interaction(interaction)
+
+    def add_interaction(self, interaction: KeyboardInteraction | MouseInteraction) -> None:
+        self.interactions.append(interaction)
+        if interaction is not self.__class__.keyboard_prompt_input_interaction:
+            self.dispatch_table.add(interaction)
 
     def get_interactions(self) -> Iterator[KeyboardInteraction, MouseInteraction]:
         return (interaction[1] for interaction in getmembers(
             self.__class__, predicate=lambda member: isinstance(member, (MouseInteraction, KeyboardInteraction))
         ))
 
+    @staticmethod
+    def spans(*text: SupportsString, sep: SupportsString = " ", end: SupportsString = "") -> tuple[Span, ...]:
+        items = [sep] * (2 * len(text) - 1) if text else []
+        items[::2] = text
+        items.append(end)
+        if not any(isinstance(item, (Text, RichText)) for item in items):
+            return Span("".join(map(str, items))),
+        return RichText.of(*items).spans
+
+    @serialized
     def print(self, *text: SupportsString, sep: SupportsString = " ", end: SupportsString = "", flush: bool = True, at: Coordinate | None = None) -> None:
         if at is not None:
-            Cursor.go_to(at)
-        print(*text, sep=str(sep), end=str(end), flush=flush)
-        for character in str(sep).join(map(str, text)) + str(end):
-            self.content[Cursor.position] = character
-            Cursor.update_position_on_print(character)
+            Cursor.position = at
+        for span in self.spans(*text, sep=sep, end=end):
+            attribute = self.content.effects_index(span.colour, span.style)
+            for character in span.text:
+                if character not in Text.CONTROL_CHARACTERS:
+                    self.content.put(Cursor.position, character, attribute)
+                Cursor.update_position_on_print(character)
+        if not self.frame_depth:
+            self.commit(flush=flush)
 
     def erase(self, at: Coordinate | None = None, flush: bool = True) -> None:
-        if at is not None:
-            Cursor.go_to(at)
-        print(self.__class__.ERASE_CHARACTER, end="", flush=flush)
-        self.content[Cursor.position] = self.__class__.ERASE_CHARACTER
-        Cursor.update_position_on_print(self.__class__.ERASE_CHARACTER)
+        self.print(self.__class__.ERASE_CHARACTER, at=at, flush=flush)
+
+    @serialized
+    def blit(self, buffer: Mapping[Coordinate, SupportsString], at: Coordinate = Coordinate(0, 0), flush: bool = True) -> None:
+        for coordinate, character in buffer.items():
+            self.content[coordinate + at] = character
+        if not self.frame_depth:
+            self.commit(flush=flush)
+
+    @serialized
+    def fill(self, region: Region | Mask, character: str = ERASE_CHARACTER, colour: Colour | None = None, flush: bool = True) -> None:
+        character = character if colour is None else Text(character, colour=colour)
+        for coordinate in region.coordinates():
+            self.content[coordinate] = character
+        if not self.frame_depth:
+            self.commit(flush=flush)
+
+    @staticmethod
+    def gradient_cells(region: Region | Mask, start: RGB, end: RGB, character: str = ERASE_CHARACTER, vertical: bool = False, gamma: float = 2.2) -> dict[Coordinate, Text]:
+        coordinates = list(region.coordinates())
+        if not coordinates:
+            return {}
+        axis = [coordinate.y if vertical else coordinate.x for coordinate in coordinates]
+        low = min(axis)
+        steps = [Text(character, colour=Colour(background=rgb)) for rgb in blending.gradient(start, end, max(axis) - low + 1, gamma=gamma)]
+        return {coordinate: steps[position - low] for coordinate, position in zip(coordinates, axis)}
+
+    def gradient_fill(self, region: Region | Mask, start: RGB, end: RGB, character: str = ERASE_CHARACTER, vertical: bool = False, gamma: float = 2.2, flush: bool = True) -> None:
+        self.blit(self.gradient_cells(region, start, end, character, vertical=vertical, gamma=gamma), flush=flush)
+
+    def is_displayed(self, at: Coordinate) -> bool:
+        (codepoint, attribute), (displayed, displayed_attribute) = self.content.cell_at(at), self.screen.cell_at(at)
+        return codepoint == displayed and self.content.effects[attribute] == self.screen.effects[displayed_attribute]
+
+    def overwrite_gap(self, to: Coordinate) -> bool:
+        start, movement = Cursor.terminal_position, Cursor.movement(to)
+        if start is None or start.y != to.y or not 0 < to.x - start.x < len(movement):
+            return False
+        gap = [Coordinate(x, to.y) for x in range(start.x, to.x)]
+        if not all(coordinate in self.screen and self.is_displayed(coordinate) for coordinate in gap):
+            return False
+        overwrite = [self.screen.cell_at(coordinate) for coordinate in gap]
+        attributes, cost = Cursor.attributes, 0
+        for _, attribute in overwrite:
+            cost += len(attributes.transition(attributes := self.screen.sgrs[attribute], Cursor.colour_depth)) + 1
+        if cost >= len(movement):
+            return False
+        Cursor.position = start  # Write the gap where the terminal cursor is, not at the last printed position
+        for codepoint, attribute in overwrite:
+            Cursor.write(chr(codepoint), flush=False, attributes=self.screen.sgrs[attribute])
+        return True
+
+    def dirty_rectangles(self) -> list[Rectangle]:
+        return self.content.dirty_rectangles()
+
+    @serialized
+    def commit(self, flush: bool = True) -> None:
+        position = Cursor.position
+        for rectangle in self.dirty_rectangles():
+            for coordinate in rectangle.coordinates():
+                if self.is_displayed(coordinate):
+                    continue
+                self.overwrite_gap(coordinate)
+                Cursor.position = coordinate
+                codepoint, attribute = self.content.cell_at(coordinate)
+                if codepoint:
+                    Cursor.write(chr(codepoint), flush=False, attributes=self.content.sgrs[attribute])
+                    self.screen.put(coordinate, chr(codepoint), self.screen.attribute_from(self.content, attribute))
+                else:
+                    Cursor.write(self.__class__.ERASE_CHARACTER, flush=False)
+                    self.screen.pop(coordinate, None)
+        self.content.reset_dirty()
+        self.screen.reset_dirty()
+        Cursor.position = position
+        if Cursor.visible:
+            Cursor.sync(flush=False)
+        if flush:
+            Cursor.output.flush()
+
+    @serialized
+    def enter_frame(self) -> None:
+        self.frame_depth += 1
+
+    @serialized
+    def exit_frame(self) -> None:
+        self.frame_depth -= 1
+        if not self.frame_depth:
+            self.commit()
+
+    @contextmanager
+    def frame(self) -> Iterator[GUI]:
+        self.enter_frame()
+        try:
+            yield self
+        finally:
+            self.exit_frame()
+
+    @contextmanager
+    def run(self, fps: float = 30, min_fps: float = 2) -> Iterator[GUI]:
+        self.frame_scheduler = FrameScheduler(self, fps, min_fps)
+        self.enter_frame()
+        self.frame_scheduler.start()
+        try:
+            yield self
+        finally:
+            self.frame_scheduler.stop()
+            self.frame_scheduler = None
+            self.exit_frame()
+
+    @contextmanager
+    def serialize(self, max_batch: int = 256) -> Iterator[GUI]:
+        self.writer.max_batch = max_batch
+        self.writer.start()
+        try:
+            yield self
+        finally:
+            self.writer.stop()
+
+    def submit(self, command: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        with self.lock:  # Commands run inline when nothing is serializing, so hold the lock like serialized methods do
+            return self.writer.submit(command, *args, **kwargs)
+
+    @contextmanager
+    def batch(self) -> Iterator[GUI]:
+        with Cursor.output.batch():
+            yield self
 
     @contextmanager
     def start(self, inputs: bool = True) -> Iterator[GUI]:
@@ -52,62 +216,199 @@ class GUI:
         self.is_running = True
         try:
             if inputs:
+                def _read() -> None:
+                    while self.is_running and (events := read_events()) is not None:
+                        for event in events:
+                            self.event_queue.put(event)
+
                 def _start() -> None:
                     while self.is_running:
                         self.update()
+                reader = KillableThread(target=_read, daemon=True)
                 thread = KillableThread(target=_start, daemon=True)
+                self.event_queue.open()
                 with console_inputs():
+                    reader.start()
                     thread.start()
                     try:
                         yield self
                     finally:
-                        thread.kill()
+                        self.is_running = False
+                        self.event_queue.close()
+                        if reader.is_alive():
+                            reader.kill()
             else:
                 yield self
         finally:
             self.is_running = False
-            Cursor.go_to(Coordinate(0, self.get_size().y + 2))
+            self.park_cursor()
+
+    @asynccontextmanager
+    async def start_async(self, inputs: bool = True) -> AsyncIterator[GUI]:
+        self.clear()
+        self.is_running = True
+        try:
+            if inputs:
+                self.event_reader = AsyncEventReader(self.event_queue)
+                with console_inputs():
+                    self.event_reader.attach()
+                    dispatcher = create_task(self.dispatch_async())
+                    try:
+                        yield self
+                    finally:
+                        self.event_reader.detach()
+                        dispatcher.cancel()
+                        with suppress(CancelledError):
+                            await dispatcher
+                        for task in list(self.consequence_tasks):
+                            task.cancel()
+                        await gather(*self.consequence_tasks, return_exceptions=True)
+            else:
+                yield self
+        finally:
+            self.is_running = False
+            self.event_reader = None
+            self.park_cursor()
+
+    @serialized
+    def park_cursor(self) -> None:
+        Cursor.reset_attributes(flush=False)
+        Cursor.go_to(Coordinate(0, self.get_size().y + 2))
+
+    async def events(self) -> AsyncIterator[KeyboardEvent | MouseEvent]:
+        subscriber = Queue()
+        self.event_subscribers.append(subscriber)
+        try:
+            while (event := await subscriber.get()) is not None:
+                yield event
+        finally:
+            self.event_subscribers.remove(subscriber)
+
+    async def dispatch_async(self) -> None:
+        try:
+            while (event := await self.event_reader.get()) is not None:
+                for subscriber in self.event_subscribers:
+                    subscriber.put_nowait(event)
+                for interaction in self.triggered_interactions(event):
+                    if iscoroutinefunction(interaction.consequence):
+                        self.schedule_consequence(interaction.consequence(self, event))
+                        continue
+                    with self.batch():
+                        consequence = interaction.consequence(self, event)
+                    if isawaitable(consequence):
+                        self.schedule_consequence(consequence)
+        finally:
+            for subscriber in self.event_subscribers:
+                subscriber.put_nowait(None)
+
+    def schedule_consequence(self, consequence: Awaitable[None]) -> None:
+        task = ensure_future(consequence)  # Run alongside the dispatcher, so the handler can await later events
+        self.consequence_tasks.add(task)
+        task.add_done_callback(self.consequence_done)
+
+    def consequence_done(self, task: Task) -> None:
+        self.consequence_tasks.discard(task)
+        if not task.cancelled() and (exception := task.exception()) is not None:
+            task.get_loop().call_exception_handler({
+                "message": "Unhandled exception in an interaction",
+                "exception": exception,
+                "task": task,
+            })
 
     def get_size(self) -> Coordinate:
-        if not self.content:
-            return Coordinate(0, 0)
-        x = max(self.content, key=lambda coordinate: coordinate.x).x
-        y = max(self.content, key=lambda coordinate: coordinate.y).y
-        return Coordinate(x, y)
-
-    def update(self) -> None:
-        event = read_console()
-        if self.is_input_mode:
-            if self.keyboard_prompt_input_interaction.matches_event(event):
-                self.keyboard_prompt_input_interaction.consequence(self, event)
+        return self.content.get_size()
+
+    def triggered_interactions(self, event: KeyboardEvent | MouseEvent) -> Iterator[KeyboardInteraction | MouseInteraction]:
+        if self.is_input_mode and self.keyboard_prompt_input_interaction.matches_event(event):
+            yield self.keyboard_prompt_input_interaction  # Keys go to the prompt - mouse interactions still run, and may cancel it
+            return
+        for interaction in self.dispatch_table.candidates(event):
+            if interaction.matches_trigger(event):
+                yield interaction
+
+    def update(self, timeout: float | None = None) -> None:
+        if (event := self.event_queue.get(timeout)) is None:
             return
-        for interaction in self.interactions:
-            if interaction.matches_event(event):
+        with self.batch():
+            for interaction in self.triggered_interactions(event):
                 interaction.consequence(self, event)
 
-    def clear(self) -> None:
+    @serialized
+    def clear(self, region: Region | Mask | None = None) -> None:
+        if region is not None:
+            for coordinate in region.coordinates():
+                if coordinate in self.content:
+                    del self.content[coordinate]
+            if not self.frame_depth:
+                self.commit()
+            return
         system("clear")
-        self.content = {}
+        Cursor.terminal_position = None
+        self.content = Grid()
+        self.screen = Grid()
     
-    def input(self, *prompt: SupportsString, sep: SupportsString = " ", end: SupportsString = "", flush: bool = True, at: Coordinate | None = None, after: SupportsString = "", echo: SupportsString = None) -> str:
+    def input(self, *prompt: SupportsString, sep: SupportsString = " ", end: SupportsString = "", flush: bool = True, at: Coordinate | None = None, after: SupportsString = "", echo: SupportsString = None, timeout: float | None = None, cancel: Event | None = None) -> str | None:
+        self.submit(self.begin_input, *prompt, sep=sep, end=end, flush=flush, at=at, echo=echo, cancel=cancel).result()
+        if not self.input_submitted.wait(timeout):
+            self.is_input_cancelled = True
+        return self.submit(self.end_input, after).result()
+
+    async def input_async(self, *prompt: SupportsString, sep: SupportsString = " ", end: SupportsString = "", flush: bool = True, at: Coordinate | None = None, after: SupportsString = "", echo: SupportsString = None, timeout: float | None = None, cancel: Event | None = None) -> str | None:
+        await wrap_future(self.submit(self.begin_input, *prompt, sep=sep, end=end, flush=flush, at=at, echo=echo, cancel=cancel))
+        loop = get_running_loop()
+        future = loop.create_future()
+        self.input_waiter = loop, future
+        if self.input_submitted.is_set():
+            future.set_result(None)
+        try:
+            await wait_for(future, timeout)
+        except AsyncTimeoutError:
+            self.is_input_cancelled = True
+        finally:
+            self.input_waiter = None
+        return await wrap_future(self.submit(self.end_input, after))
+
+    def begin_input(self, *prompt: SupportsString, sep: SupportsString = " ", end: SupportsString = "", flush: bool = True, at: Coordinate | None = None, echo: SupportsString = None, cancel: Event | None = None) -> None:
         self.print(*prompt, sep=sep, end=end, flush=flush, at=at)
         self.input_cursor_position_stamp = Cursor.position
         self.input_echo = echo
+        self.input_cancel_event = cancel
+        self.is_input_cancelled = False
+        self.input_submitted.clear()
         self.is_input_mode = True
         Cursor.show()
-        while self.is_input_mode:
-            pass
+
+    def submit_input(self) -> None:
+        self.is_input_mode = False
+        self.input_submitted.set()
+        if (waiter := self.input_waiter) is not None:
+            loop, future = waiter
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+
+    def cancel_input(self) -> None:
+        if self.is_input_mode:
+            self.is_input_cancelled = True
+            self.submit_input()
+
+    def end_input(self, after: SupportsString = "") -> str | None:
+        self.is_input_mode = False
         Cursor.hide()
         if after:
             self.print(after)
-        buffer = self.input_buffer
+        buffer = None if self.is_input_cancelled else self.input_buffer
         self.input_buffer = ""
+        self.input_echo_positions = []
+        self.input_cancel_event = None
         return buffer
-    
+
     @KeyboardInteraction(Events.ANY_KEYBOARD.value)
+    @serialized  # Echo positions come from the cursor, which the writer owns while serializing
     def keyboard_prompt_input_interaction(self, event: KeyboardEvent) -> None:
         if event == Events.ENTER.value:
-            self.is_input_mode = False
+            self.submit_input()
+            return
+        elif self.input_cancel_event is not None and self.input_cancel_event.trigger_condition(event):
+            self.cancel_input()
             return
         input_name_mapping = {
             Events.TAB.value.name: Text.TAB,
@@ -116,11 +417,14 @@ class GUI:
         if event == Events.BACKSPACE.value:
             if not self.input_buffer:
                 return
-            Cursor.go_to(self.input_cursor_position_stamp)
-            Cursor.clear_line(before_cursor=False)
+            start = self.input_echo_positions.pop()
+            with self.frame():
+                for x in range(start.x, Cursor.position.x):
+                    self.erase(at=Coordinate(x, start.y))
+                Cursor.position = start
             self.input_buffer = self.input_buffer[:-1]
-            self.print(self.input_buffer, at=self.input_cursor_position_stamp)
             return
         character = input_name_mapping.get(event.name, event.name)
+        self.input_echo_positions.append(Cursor.position)
         self.print(character if self.input_echo is None else self.input_echo)
         self.input_buffer += character
@@ -1,8 +1,8 @@
 from __future__ import annotations
-from typing import Callable, TYPE_CHECKING
+from typing import Awaitable, Callable, TYPE_CHECKING
 from dataclasses import dataclass, field
 from ..input import KeyboardEvent, MouseEvent, Event
-from ..geometry import Region
+from ..geometry import Mask, Region
 if TYPE_CHECKING:
     from .gui import GUI
 
@@ -10,15 +10,18 @@ if TYPE_CHECKING:
 @dataclass(frozen=True, slots=True)
 class MouseInteraction:
     event: Event
-    region: Region | None = None
-    consequence: Callable[[GUI, MouseEvent], None] | None = field(default=None, init=False)
+    region: Region | Mask | None = None
+    consequence: Callable[[GUI, MouseEvent], Awaitable[None] | None] | None = field(default=None, init=False)
 
-    def __call__(self, consequence: Callable[[GUI, MouseEvent], None]) -> MouseInteraction:
+    def __call__(self, consequence: Callable[[GUI, MouseEvent], Awaitable[None] | None]) -> MouseInteraction:
         object.__setattr__(self, "consequence", consequence)
         return self
 
-    def matches_event(self, event: KeyboardEvent | MouseEvent) -> bool:
+    def matches_trigger(self, event: KeyboardEvent | MouseEvent) -> bool:
         if isinstance(event, KeyboardEvent):
             return False
+        return self.event.trigger_condition(event)
+
+    def matches_event(self, event: KeyboardEvent | MouseEvent) -> bool:
         passed_region_check = True if self.region is None else event.coordinate in self.region
-        return self.event.trigger_condition(event) and passed_region_check
+        return self.matches_trigger(event) and passed_region_check
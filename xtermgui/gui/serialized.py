@@ -0,0 +1,17 @@
+from __future__ import annotations
+from functools import wraps
+from typing import Any, Callable, TypeVar
+
+
+Method = TypeVar("Method", bound=Callable[..., Any])
+
+
+def serialized(method: Method) -> Method:
+    @wraps(method)
+    def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        owner = getattr(self, "gui", self)  # Layers are serialized by the GUI that owns them
+        if (writer := owner.writer) is not None and writer.is_running and not writer.is_writer_thread:
+            return writer.submit(method, self, *args, **kwargs)
+        with owner.lock:
+            return method(self, *args, **kwargs)
+    return wrapper
@@ -0,0 +1,96 @@
+from __future__ import annotations
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from io import StringIO
+from typing import ClassVar, Iterator
+from .grid import Grid
+from .gui import GUI
+from ..geometry import Coordinate, Mask, Region
+from ..control import Colour, Cursor, Output, RGB, Text
+from ..utils import SupportsString
+
+
+@dataclass(slots=True, eq=False)
+class Surface(Mapping):
+    ERASE_CHARACTER: ClassVar[str] = ' '
+    width: int = 0
+    height: int = 0
+    content: Grid = field(init=False, repr=False)
+    cursor: Cursor = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.content = Grid(self.width, self.height)
+        self.cursor = Cursor(Output(StringIO()))
+
+    @classmethod
+    def from_grid(cls, content: Grid, position: Coordinate = Coordinate(0, 0)) -> Surface:
+        surface = cls(content.width, content.height)
+        surface.content = content
+        surface.cursor.position = position
+        return surface
+
+    def print(self, *text: SupportsString, sep: SupportsString = " ", end: SupportsString = "", at: Coordinate | None = None) -> None:
+        if at is not None:
+            self.cursor.position = at
+        for span in GUI.spans(*text, sep=sep, end=end):
+            attribute = self.content.effects_index(span.colour, span.style)
+            for character in span.text:
+                if character not in Text.CONTROL_CHARACTERS:
+                    self.content.put(self.cursor.position, character, attribute)
+                self.cursor.update_position_on_print(character)
+
+    def erase(self, at: Coordinate | None = None) -> None:
+        self.print(self.__class__.ERASE_CHARACTER, at=at)
+
+    def blit(self, buffer: Mapping[Coordinate, SupportsString], at: Coordinate = Coordinate(0, 0)) -> None:
+        for coordinate, character in buffer.items():
+            self.content[coordinate + at] = character
+
+    def fill(self, region: Region | Mask, character: str = ERASE_CHARACTER, colour: Colour | None = None) -> None:
+        character = character if colour is None else Text(character, colour=colour)
+        for coordinate in region.coordinates():
+            self.content[coordinate] = character
+
+    def gradient_fill(self, region: Region | Mask, start: RGB, end: RGB, character: str = ERASE_CHARACTER, vertical: bool = False, gamma: float = 2.2) -> None:
+        self.blit(GUI.gradient_cells(region, start, end, character, vertical=vertical, gamma=gamma))
+
+    def clear(self, region: Region | Mask | None = None) -> None:
+        if region is None:
+            self.content = Grid(self.content.width, self.content.height)
+            return
+        for coordinate in region.coordinates():
+            if coordinate in self.content:
+                del self.content[coordinate]
+
+    def get_size(self) -> Coordinate:
+        return self.content.get_size()
+
+    def render(self, at: Coordinate = Coordinate(0, 0)) -> str:
+        cursor, position = self.cursor, self.cursor.position
+        cursor.terminal_position = None
+        for y in range(self.content.bottom + 1):
+            for x, character in enumerate(self.content.row(y, 0, self.content.right + 1)):
+                if character is not None:
+                    cursor.position = Coordinate(x + at.x, y + at.y)
+                    cursor.write(character, flush=False)
+        cursor.reset_attributes()
+        cursor.position, cursor.terminal_position = position, None
+        rendered = cursor.output.stream.getvalue()
+        cursor.output.stream.seek(0)
+        cursor.output.stream.truncate()
+        return rendered
+
+    def __reduce__(self) -> tuple:
+        return self.__class__.from_grid, (self.content, self.cursor.position)
+
+    def __getitem__(self, at: Coordinate) -> SupportsString:
+        return self.content[at]
+
+    def __iter__(self) -> Iterator[Coordinate]:
+        return iter(self.content)
+
+    def __len__(self) -> int:
+        return len(self.content)
+
+    def __contains__(self, at: object) -> bool:
+        return at in self.content
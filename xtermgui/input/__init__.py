@@ -1,4 +1,8 @@
-from .input import read_console
+from .input import read_console, read_events
+from .parser import InputParser
+from .event_queue import EventQueue
+from .drop_policy import DropPolicy
+from .async_event_reader import AsyncEventReader
 from .setup import console_inputs
 from .event import Event
 from .events import Events
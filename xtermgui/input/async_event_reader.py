@@ -0,0 +1,67 @@
+from __future__ import annotations
+from asyncio import AbstractEventLoop, Event as AsyncEvent, get_running_loop
+from collections import deque
+from dataclasses import dataclass, field
+from queue import Full
+from sys import stdin
+from .event_queue import EventQueue
+from .input import read_events
+from .keyboard_event import KeyboardEvent
+from .mouse_event import MouseEvent
+
+
+@dataclass(slots=True)
+class AsyncEventReader:
+    event_queue: EventQueue
+    descriptor: int = field(default_factory=stdin.fileno)
+    loop: AbstractEventLoop | None = field(default=None, init=False, repr=False)
+    backlog: deque[KeyboardEvent | MouseEvent] = field(default_factory=deque, init=False, repr=False)
+    available: AsyncEvent = field(default_factory=AsyncEvent, init=False, repr=False)
+    is_reading: bool = field(default=False, init=False)
+
+    def attach(self, loop: AbstractEventLoop | None = None) -> None:
+        self.loop = get_running_loop() if loop is None else loop
+        self.event_queue.open()
+        self.resume()
+
+    def detach(self) -> None:
+        self.pause()
+        self.event_queue.close()
+        self.available.set()
+
+    def resume(self) -> None:
+        if not self.is_reading and not self.event_queue.is_closed:
+            self.loop.add_reader(self.descriptor, self.receive)
+            self.is_reading = True
+
+    def pause(self) -> None:
+        if self.is_reading:
+            self.loop.remove_reader(self.descriptor)
+            self.is_reading = False
+
+    def receive(self) -> None:
+        if (events := read_events()) is None:
+            self.detach()
+            return
+        self.backlog.extend(events)
+        self.drain()
+
+    def drain(self) -> None:
+        while self.backlog:
+            try:
+                self.event_queue.put(self.backlog[0], timeout=0)
+            except Full:
+                self.pause()  # Leave the rest in the terminal until the queue has space
+                return
+            self.backlog.popleft()
+            self.available.set()
+        self.resume()
+
+    async def get(self) -> KeyboardEvent | MouseEvent | None:
+        while (event := self.event_queue.get(timeout=0)) is None:
+            if self.event_queue.is_closed:
+                return
+            self.available.clear()
+            await self.available.wait()
+        self.drain()
+        return event
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class DropPolicy(Enum):
+    DROP_OLDEST: str = "DROP_OLDEST"
+    DROP_NEWEST: str = "DROP_NEWEST"
+    BLOCK: str = "BLOCK"
@@ -9,9 +9,11 @@ from .mouse_event import MouseEvent
 class Event:
     name: str
     trigger_condition: Callable[[KeyboardEvent | MouseEvent], bool] | None = None
+    matches_name: bool = field(default=False, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if self.trigger_condition is None:
+            object.__setattr__(self, "matches_name", True)
             object.__setattr__(self, "trigger_condition", lambda event: event.name == self.name)
     
     def __eq__(self, other: Event | KeyboardEvent | MouseEvent) -> bool:
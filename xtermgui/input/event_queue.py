@@ -0,0 +1,92 @@
+from __future__ import annotations
+from collections import deque
+from dataclasses import dataclass, field
+from queue import Full
+from threading import Condition
+from time import monotonic
+from .drop_policy import DropPolicy
+from .keyboard_event import KeyboardEvent
+from .mouse_event import MouseEvent
+from .mouse_codes import MouseCodes
+from .parser import MODIFIER_PREFIXES
+
+
+MOTION_EVENT_NAMES = frozenset(
+    f"{prefix}{code.name}" for prefix in MODIFIER_PREFIXES for code in (
+        MouseCodes.MOVE, MouseCodes.LEFT_MOUSE_DRAG, MouseCodes.MIDDLE_MOUSE_DRAG, MouseCodes.RIGHT_MOUSE_DRAG
+    )
+)
+
+
+@dataclass(slots=True)
+class EventQueue:
+    max_size: int = 256
+    drop_policy: DropPolicy = DropPolicy.DROP_OLDEST
+    events: deque[KeyboardEvent | MouseEvent] = field(default_factory=deque, init=False, repr=False)
+    condition: Condition = field(default_factory=Condition, init=False, repr=False)
+    dropped: int = field(default=0, init=False)
+    is_closed: bool = field(default=False, init=False)
+
+    def __post_init__(self) -> None:
+        if self.max_size < 1:
+            raise ValueError("The maximum size of an event queue must be at least 1") from None
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    @staticmethod
+    def is_motion(event: KeyboardEvent | MouseEvent) -> bool:
+        return isinstance(event, MouseEvent) and event.name in MOTION_EVENT_NAMES
+
+    def put(self, event: KeyboardEvent | MouseEvent, timeout: float | None = None) -> bool:
+        is_motion = self.is_motion(event)
+        deadline = None if timeout is None else monotonic() + timeout
+        with self.condition:
+            if self.is_closed:
+                return False
+            if is_motion and self.events and self.events[-1].name == event.name:
+                self.events[-1] = event
+                return True
+            while len(self.events) >= self.max_size:
+                if self.drop_policy is DropPolicy.BLOCK:
+                    self.wait(deadline)
+                elif is_motion and (self.drop_policy is DropPolicy.DROP_NEWEST or not self.evict_motion()):
+                    self.dropped += 1
+                    return False
+                elif not is_motion and not self.evict_motion():
+                    self.wait(deadline)
+                if self.is_closed:
+                    return False
+            self.events.append(event)
+            self.condition.notify_all()
+            return True
+
+    def wait(self, deadline: float | None) -> None:
+        if not self.condition.wait(None if deadline is None else max(deadline - monotonic(), 0)):
+            raise Full("Timed out waiting for space in the event queue") from None
+
+    def evict_motion(self) -> bool:
+        for index, event in enumerate(self.events):
+            if self.is_motion(event):
+                del self.events[index]
+                self.dropped += 1
+                return True
+        return False
+
+    def get(self, timeout: float | None = None) -> KeyboardEvent | MouseEvent | None:
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.events or self.is_closed, timeout) or not self.events:
+                return None
+            event = self.events.popleft()
+            self.condition.notify_all()
+            return event
+
+    def open(self) -> None:
+        with self.condition:
+            self.events.clear()
+            self.is_closed = False
+
+    def close(self) -> None:
+        with self.condition:
+            self.is_closed = True
+            self.condition.notify_all()
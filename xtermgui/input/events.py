@@ -19,6 +19,19 @@ class Events(Enum):
     HOME: Event = Event("HOME")
     SHIFT_TAB: Event = Event("SHIFT_TAB")
 
+    CTRL_UP_ARROW: Event = Event("CTRL_UP_ARROW")
+    CTRL_DOWN_ARROW: Event = Event("CTRL_DOWN_ARROW")
+    CTRL_RIGHT_ARROW: Event = Event("CTRL_RIGHT_ARROW")
+    CTRL_LEFT_ARROW: Event = Event("CTRL_LEFT_ARROW")
+    ALT_UP_ARROW: Event = Event("ALT_UP_ARROW")
+    ALT_DOWN_ARROW: Event = Event("ALT_DOWN_ARROW")
+    ALT_RIGHT_ARROW: Event = Event("ALT_RIGHT_ARROW")
+    ALT_LEFT_ARROW: Event = Event("ALT_LEFT_ARROW")
+    SHIFT_UP_ARROW: Event = Event("SHIFT_UP_ARROW")
+    SHIFT_DOWN_ARROW: Event = Event("SHIFT_DOWN_ARROW")
+    SHIFT_RIGHT_ARROW: Event = Event("SHIFT_RIGHT_ARROW")
+    SHIFT_LEFT_ARROW: Event = Event("SHIFT_LEFT_ARROW")
+
     LEFT_MOUSE_UP: Event = Event("LEFT_MOUSE_UP")
     LEFT_MOUSE_DOWN: Event = Event("LEFT_MOUSE_DOWN")
     MIDDLE_MOUSE_UP: Event = Event("MIDDLE_MOUSE_UP")
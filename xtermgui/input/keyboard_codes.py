@@ -15,6 +15,10 @@ class KeyboardCodes(Enum):
     END: str = "[F"
     HOME: str = "[H"
     SHIFT_TAB: str = "[Z"
+    F1: str = "OP"
+    F2: str = "OQ"
+    F3: str = "OR"
+    F4: str = "OS"
 
     INSERT: str = "2"
     DELETE: str = "3"
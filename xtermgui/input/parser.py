@@ -0,0 +1,110 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from .keyboard_event import KeyboardEvent
+from .mouse_event import MouseEvent
+from .keyboard_codes import KeyboardCodes
+from .mouse_codes import MouseCodes
+from ..geometry import Coordinate
+
+
+CONTROL_CODES = {
+    code.value: code.name for code in KeyboardCodes if isinstance(code.value, int)
+}
+FINAL_CODES = {
+    code.value[-1]: code.name for code in KeyboardCodes if isinstance(code.value, str) and code.value[0] in "[O"
+}
+TILDE_CODES = {
+    int(code.value): code.name for code in KeyboardCodes if isinstance(code.value, str) and code.value.isdigit()
+}
+MOUSE_CODES = {
+    code.value: code.name for code in MouseCodes
+}
+MODIFIER_PREFIXES = tuple(
+    "CTRL_" * bool(modifiers & 4) + "ALT_" * bool(modifiers & 2) + "SHIFT_" * bool(modifiers & 1)
+    for modifiers in range(8)
+)
+MOUSE_MODIFIER_BITS = 4 | 8 | 16
+
+
+@dataclass(slots=True)
+class InputParser:
+    buffer: str = field(default="", init=False)
+    position: int = field(default=0, init=False, repr=False)
+
+    def feed(self, data: str) -> list[KeyboardEvent | MouseEvent]:
+        self.buffer = self.buffer[self.position:] + data
+        self.position = 0
+        events = []
+        while self.position < len(self.buffer):
+            if (parsed := self.parse_event(self.position)) is None:
+                break
+            event, self.position = parsed
+            events.append(event)
+        return events
+
+    def parse_event(self, start: int) -> tuple[KeyboardEvent | MouseEvent, int] | None:
+        read_key = self.buffer[start]
+        key_code = ord(read_key)
+        if 32 <= key_code < 127:
+            return KeyboardEvent(read_key), start + 1
+        elif key_code == 27:
+            return self.parse_escape_sequence(start + 1)
+        elif (name := CONTROL_CODES.get(key_code)) is not None:
+            return KeyboardEvent(name), start + 1
+        return KeyboardEvent(KeyboardEvent.UNRECOGNIZED), start + 1
+
+    def parse_escape_sequence(self, start: int) -> tuple[KeyboardEvent | MouseEvent, int] | None:
+        if start >= len(self.buffer):
+            return None
+        introducer = self.buffer[start]
+        if introducer == '[':
+            return self.parse_control_sequence(start + 1)
+        elif introducer == 'O':
+            if start + 1 >= len(self.buffer):
+                return None
+            return self.keyboard_event(FINAL_CODES.get(self.buffer[start + 1]), 1), start + 2
+        elif 32 <= ord(introducer) < 127:
+            return KeyboardEvent(f"{MODIFIER_PREFIXES[2]}{introducer}"), start + 1
+        return KeyboardEvent(KeyboardEvent.UNRECOGNIZED), start
+
+    def parse_control_sequence(self, start: int) -> tuple[KeyboardEvent | MouseEvent, int] | None:
+        buffer = self.buffer
+        is_mouse = start < len(buffer) and buffer[start] == '<'
+        parameters = [0]
+        is_private = False
+        for end in range(start + is_mouse, len(buffer)):
+            character = buffer[end]
+            if '0' <= character <= '9':
+                parameters[-1] = parameters[-1] * 10 + ord(character) - 48
+            elif character == ';':
+                parameters.append(0)
+            elif '@' <= character <= '~':
+                break
+            else:
+                is_private = True
+        else:
+            return None
+        if is_mouse and character in "Mm" and len(parameters) == 3:
+            return self.mouse_event(parameters, character == 'M'), end + 1
+        elif is_mouse or is_private:
+            return KeyboardEvent(KeyboardEvent.UNRECOGNIZED), end + 1
+        elif character == '~':
+            name = TILDE_CODES.get(parameters[0])
+        else:
+            name = FINAL_CODES.get(character)
+        return self.keyboard_event(name, parameters[1] if len(parameters) > 1 else 1), end + 1
+
+    @staticmethod
+    def keyboard_event(name: str | None, modifier_parameter: int) -> KeyboardEvent:
+        if name is None:
+            return KeyboardEvent(KeyboardEvent.UNRECOGNIZED)
+        return KeyboardEvent(f"{MODIFIER_PREFIXES[max(modifier_parameter - 1, 0) & 7]}{name}")
+
+    @staticmethod
+    def mouse_event(parameters: list[int], is_press: bool) -> MouseEvent:
+        button, x, y = parameters
+        base_button = button & ~MOUSE_MODIFIER_BITS
+        code = f"{base_button}{int(is_press)}" if base_button < 3 else str(base_button)
+        if (name := MOUSE_CODES.get(code)) is None or x < 1 or y < 1:
+            return MouseEvent(MouseEvent.UNRECOGNIZED, Coordinate(0, 0))
+        return MouseEvent(f"{MODIFIER_PREFIXES[(button & MOUSE_MODIFIER_BITS) >> 2]}{name}", Coordinate(x - 1, y - 1))
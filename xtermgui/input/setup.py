@@ -1,7 +1,9 @@
 from subprocess import run, PIPE
-from sys import executable, __stdout__, stdin
+from sys import executable, stdin
 from contextlib import contextmanager
+from signal import SIGWINCH, getsignal, signal
 from termios import tcgetattr, tcsetattr, ECHO, ICANON, TCSADRAIN
+from threading import current_thread, main_thread
 from typing import Iterator
 from ..control import Cursor
 
@@ -17,9 +19,16 @@ def console_inputs() -> Iterator[None]:
     original_state = tcgetattr(stdin)
     new_state = original_state[:]
 
-    Cursor.hide()
+    Cursor.configure_terminal_width()
+    is_main_thread = current_thread() is main_thread()
+    if is_main_thread:  # Signal handlers can only be installed from the main thread
+        original_handler = getsignal(SIGWINCH)
+        signal(SIGWINCH, lambda *_: Cursor.configure_terminal_width())
+
+    Cursor.hide(flush=False)
     for escape_code in setup_commands:
-        __stdout__.write(escape_code)
+        Cursor.output.write(escape_code, flush=False)
+    Cursor.output.flush()
 
     new_state[3] -= (ECHO + ICANON)
     tcsetattr(stdin, TCSADRAIN, new_state)  # Disable ECHO and ICANON
@@ -28,7 +37,10 @@ def console_inputs() -> Iterator[None]:
         yield
     finally:
         tcsetattr(stdin, TCSADRAIN, original_state)  # Enable ECHO and ICANON
+        if is_main_thread:
+            signal(SIGWINCH, original_handler)
         # run((executable, "-c", "input()"), input="", stderr=PIPE, encoding="utf-8")  # Runs input() in a subprocess
+        Cursor.reset_attributes(flush=False)
         for escape_code in cleanup_commands:
-            __stdout__.write(escape_code)
+            Cursor.output.write(escape_code, flush=False)
         Cursor.show()
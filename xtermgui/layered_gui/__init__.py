@@ -1,2 +1,4 @@
 from .gui import LayeredGUI
+from .compositor import Compositor
+from .registry import LayerRegistry
 from .layer import Layer
@@ -0,0 +1,48 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from .registry import LayerRegistry
+from ..geometry import Coordinate
+from ..utils import SupportsString
+if TYPE_CHECKING:
+    from .layer import Layer
+
+
+@dataclass(slots=True)
+class Compositor:
+    layers: LayerRegistry
+    occupancy: dict[Coordinate, int] = field(default_factory=dict, init=False, repr=False)
+
+    def top_of(self, mask: int) -> Layer | None:
+        while mask:
+            layer = self.layers.slots[(mask & -mask).bit_length() - 1]
+            if not mask & layer.above:
+                return layer
+            mask &= mask - 1
+        return None
+
+    def release(self, layer: Layer) -> None:
+        for at in layer.content:
+            self.vacate(layer, at)
+
+    def occupy(self, layer: Layer, at: Coordinate) -> None:
+        self.occupancy[at] = self.occupancy.get(at, 0) | (1 << layer.slot)
+
+    def vacate(self, layer: Layer, at: Coordinate) -> None:
+        if mask := self.occupancy.get(at, 0) & ~(1 << layer.slot):
+            self.occupancy[at] = mask
+        else:
+            self.occupancy.pop(at, None)
+
+    def top_at(self, at: Coordinate) -> Layer | None:
+        return self.top_of(self.occupancy.get(at, 0))
+
+    def is_visible(self, layer: Layer, at: Coordinate) -> bool:
+        return not self.occupancy.get(at, 0) & layer.above
+
+    def revealed_at(self, layer: Layer, at: Coordinate, default: SupportsString) -> SupportsString | None:
+        if not self.is_visible(layer, at):
+            return None
+        elif not (mask := self.occupancy.get(at, 0) & ~(1 << layer.slot)):
+            return default
+        return self.top_of(mask).content[at]
@@ -1,93 +1,172 @@
 from __future__ import annotations
 from contextlib import contextmanager
-from typing import Callable, Iterator
+from functools import wraps
+from inspect import signature
+from typing import Any, Callable, Iterator, Mapping, TypeVar
 from dataclasses import dataclass, field
-from heapq import heappush, nlargest, nsmallest
-from copy import copy
+from .compositor import Compositor
 from .layer import Layer
-from ..gui import GUI
-from ..geometry import Coordinate
-from ..control import Cursor
-from ..utils import SupportsString, SupportsLessThan
+from .registry import LayerRegistry
+from ..gui import GUI, serialized
+from ..geometry import Coordinate, Mask, Region
+from ..control import Colour, Cursor, RGB, Text
+from ..utils import SupportsString
+
+
+Method = TypeVar("Method", bound=Callable[..., Any])
+
+
+def on_active_layer(method: Method) -> Method:
+    parameters = signature(method)
+
+    @wraps(method)
+    def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        # Resolve the default layer in the calling thread, before the call is queued for the writer
+        arguments = parameters.bind(self, *args, **kwargs)
+        if arguments.arguments.get("layer") is None:
+            arguments.arguments["layer"] = self.active_layer
+        return method(*arguments.args, **arguments.kwargs)
+    return wrapper
 
 
 @dataclass(slots=True)
 class LayeredGUI(GUI):
     base_layer_name: str = "Base"
-    layers: list[Layer | SupportsLessThan] = field(default_factory=list, init=False)
+    layers: LayerRegistry = field(default_factory=LayerRegistry, init=False)
+    compositor: Compositor = field(init=False, repr=False)
     base_layer: Layer = field(init=False)
     active_layer: Layer = field(init=False)
 
     def __post_init__(self) -> None:
         super(LayeredGUI, self).__post_init__()
+        self.compositor = Compositor(self.layers)
         self.base_layer = self.add_layer(self.base_layer_name, 0)
         self.active_layer = self.base_layer
 
+    @on_active_layer
+    @serialized
     def print(self, *text: SupportsString, sep: SupportsString = " ", end: SupportsString = "", flush: bool = True, at: Coordinate | None = None, layer: Layer | None = None, force: bool = False) -> None:
         if at is not None:
-            Cursor.go_to(at)
-        else:
-            at = Cursor.position
-        if layer is None:
-            layer = self.active_layer
-        if force or layer.can_print_at(at):
-            print(*text, sep=str(sep), end=str(end), flush=flush)
-        for character in str(sep).join(map(str, text)) + str(end):
-            layer.write(character, at=Cursor.position)
-            Cursor.update_position_on_print(character)
+            Cursor.position = at
+        for span in self.spans(*text, sep=sep, end=end):
+            attributes = layer.attributes_of(span.colour, span.style)
+            for character in span.text:
+                if character not in Text.CONTROL_CHARACTERS:
+                    layer.put(character, attributes, Cursor.position, force=force)
+                Cursor.update_position_on_print(character)
+        if not self.frame_depth:
+            self.commit(flush=flush)
 
+    @on_active_layer
+    @serialized
     def erase(self, at: Coordinate | None = None, flush: bool = True, layer: Layer | None = None, force: bool = False) -> None:
         if at is not None:
-            Cursor.go_to(at)
+            Cursor.position = at
         else:
             at = Cursor.position
-        if layer is None:
-            layer = self.active_layer
-        if force:
-            print(self.__class__.ERASE_CHARACTER, end="", flush=flush)
-        elif (new_character := layer.new_character_on_erase_at(at)) is not None:
-            print(new_character, end="", flush=flush)
-        layer.erase_content(at=at)
+        layer.undraw(at, force=force)
         Cursor.update_position_on_print(self.__class__.ERASE_CHARACTER)
+        if not self.frame_depth:
+            self.commit(flush=flush)
+
+    @on_active_layer
+    @serialized
+    def blit(self, buffer: Mapping[Coordinate, SupportsString], at: Coordinate = Coordinate(0, 0), flush: bool = True, layer: Layer | None = None, force: bool = False) -> None:
+        layer.blit(buffer, at=at, force=force)
+        if not self.frame_depth:
+            self.commit(flush=flush)
+
+    @on_active_layer
+    @serialized
+    def fill(self, region: Region | Mask, character: str = GUI.ERASE_CHARACTER, colour: Colour | None = None, flush: bool = True, layer: Layer | None = None, force: bool = False) -> None:
+        layer.fill(region, character, colour=colour, force=force)
+        if not self.frame_depth:
+            self.commit(flush=flush)
+
+    def gradient_fill(self, region: Region | Mask, start: RGB, end: RGB, character: str = GUI.ERASE_CHARACTER, vertical: bool = False, gamma: float = 2.2, flush: bool = True, layer: Layer | None = None, force: bool = False) -> None:
+        self.blit(self.gradient_cells(region, start, end, character, vertical=vertical, gamma=gamma), flush=flush, layer=layer, force=force)
 
     def get_size(self) -> Coordinate:
-        return max(map(lambda layer: layer.get_size(), self.layers))
+        sizes = [layer.get_size() for layer in self.layers]
+        return Coordinate(max(size.x for size in sizes), max(size.y for size in sizes))
+
+    @serialized
+    def commit(self, flush: bool = True) -> None:
+        super(LayeredGUI, self).commit(flush=flush)
+        for layer in self.layers:
+            layer.content.reset_dirty()
 
     def add_layer(self, name: str, z: float | None = None) -> Layer:
+        return self.submit(self.insert_layer, name, z).result()
+
+    def insert_layer(self, name: str, z: float | None = None) -> Layer:
         if z is None:
-            z = max(self.layers).z
+            z = self.layers.top().z
         layer = Layer(self, name, z)
-        heappush(self.layers, layer)
+        self.layers.add(layer)
         return layer
 
-    def get_layer(self, key: Callable[[Layer], bool]) -> Layer:
+    def get_layer(self, key: Callable[[Layer], bool] | str) -> Layer:
+        if isinstance(key, str):
+            if (layer := self.layers.get(key)) is None:
+                raise KeyError(key) from None
+            return layer
         return next(layer for layer in self.layers if key(layer))
 
+    @serialized
     def remove_layer(self, name: str) -> None:
-        self.layers = list(filter(lambda layer: layer.name == name, self.layers))
+        if (layer := self.layers.get(name)) is None:
+            return
+        for at in layer.content:
+            if (new_character := layer.new_character_on_erase_at(at)) is not None:
+                self.content[at] = new_character
+        self.compositor.release(layer)
+        self.layers.remove(layer)
+        if not self.frame_depth:
+            self.commit()
 
-    def traverse_layers(self, start: int = 0, end: int | None = None, reverse: bool = False):
-        if end is None:
-            layers = list(reversed(self.layers)) if reverse else self.layers
-        else:
-            n = end - start
-            layers = nlargest(n, self.layers) if reverse else nsmallest(n, self.layers)
-        return (layer for layer in layers[start:])
+    @serialized
+    def set_z(self, layer: Layer, z: float, below_equal: bool = False) -> None:
+        self.layers.move(layer, z, below_equal=below_equal)
+        for at in layer.content:
+            self.content[at] = self.compositor.top_at(at).content[at]
+        if not self.frame_depth:
+            self.commit()
 
-    def clear(self, layer: Layer | None = None) -> None:
-        if layer is None:
+    @serialized
+    def raise_layer(self, layer: Layer) -> None:
+        if layer.index < len(self.layers) - 1:
+            self.set_z(layer, self.layers[layer.index + 1].z)
+
+    @serialized
+    def lower_layer(self, layer: Layer) -> None:
+        if layer.index > 0:
+            self.set_z(layer, self.layers[layer.index - 1].z, below_equal=True)
+
+    def traverse_layers(self, start: int = 0, end: int | None = None, reverse: bool = False) -> Iterator[Layer]:
+        layers = self.layers[::-1] if reverse else self.layers[:]
+        return (layer for layer in layers[start:end])
+
+    @serialized
+    def clear(self, layer: Layer | None = None, region: Region | Mask | None = None) -> None:
+        if layer is None and region is None:
             super(LayeredGUI, self).clear()
             for layer in self.layers:
                 layer.clear_content()
             return
-        for coordinate in copy(layer.content):
-            self.erase(at=coordinate, layer=layer)
+        for layer in reversed(self.layers) if layer is None else (layer,):
+            layer.clear(region)
+        if not self.frame_depth:
+            self.commit()
+
+    def activate(self, layer: Layer) -> Layer:
+        previous_active_layer, self.active_layer = self.active_layer, layer
+        return previous_active_layer
 
     @contextmanager
     def as_active(self, layer: Layer) -> Iterator[Layer]:
-        previous_active_layer = self.active_layer
-        self.active_layer = layer
+        previous_active_layer = self.submit(self.activate, layer).result()
         try:
             yield layer
         finally:
-            self.active_layer = previous_active_layer
+            self.submit(self.activate, previous_active_layer).result()
@@ -1,9 +1,10 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Mapping, TYPE_CHECKING
 from dataclasses import dataclass, field
-from ..control import Cursor
+from ..control import Colour, Cursor, Style, Text
 from ..utils import SupportsString
-from ..geometry import Coordinate
+from ..geometry import Coordinate, Mask, Region
+from ..gui import Grid, serialized
 if TYPE_CHECKING:
     from .gui import LayeredGUI
 
@@ -13,41 +14,84 @@ class Layer:
     gui: LayeredGUI = field(compare=False, repr=False)
     name: str = field(compare=False)
     z: float
-    content: dict[Coordinate, SupportsString] = field(compare=False, init=False, default_factory=dict, repr=False)
+    content: Grid = field(compare=False, init=False, default_factory=Grid, repr=False)
+    index: int = field(default=-1, compare=False, init=False, repr=False)
+    slot: int = field(default=-1, compare=False, init=False, repr=False)
+    above: int = field(default=0, compare=False, init=False, repr=False)
 
+    @serialized
     def write(self, text: SupportsString, at: Coordinate | None = None):
         if at is None:
             at = Cursor.position
         self.content[at] = text
+        self.gui.compositor.occupy(self, at)
 
+    @serialized
     def erase_content(self, at: Coordinate | None = None):
         if at is None:
             at = Cursor.position
         if at in self.content:
             del self.content[at]
+            self.gui.compositor.vacate(self, at)
+
+    def attributes_of(self, colour: Colour, style: Style) -> tuple[int, int]:
+        return self.gui.content.effects_index(colour, style), self.content.effects_index(colour, style)
+
+    def put(self, character: str, attributes: tuple[int, int], at: Coordinate, force: bool = False) -> None:
+        if force or self.can_print_at(at):
+            self.gui.content.put(at, character, attributes[0])
+        self.content.put(at, character, attributes[1])
+        self.gui.compositor.occupy(self, at)
+
+    @serialized
+    def draw(self, character: SupportsString, at: Coordinate, force: bool = False) -> None:
+        if force or self.can_print_at(at):
+            self.gui.content[at] = character
+        self.write(character, at=at)
+
+    @serialized
+    def undraw(self, at: Coordinate, force: bool = False) -> None:
+        if force:
+            new_character = self.gui.__class__.ERASE_CHARACTER
+        else:
+            new_character = self.new_character_on_erase_at(at)
+        if new_character is not None:
+            self.gui.content[at] = new_character
+        self.erase_content(at=at)
+
+    @serialized
+    def blit(self, buffer: Mapping[Coordinate, SupportsString], at: Coordinate = Coordinate(0, 0), force: bool = False) -> None:
+        for coordinate, character in buffer.items():
+            self.draw(character, coordinate + at, force=force)
+
+    @serialized
+    def fill(self, region: Region | Mask, character: str, colour: Colour | None = None, force: bool = False) -> None:
+        character = character if colour is None else Text(character, colour=colour)
+        for coordinate in region.coordinates():
+            self.draw(character, coordinate, force=force)
+
+    @serialized
+    def clear(self, region: Region | Mask | None = None) -> None:
+        coordinates = list(self.content) if region is None else [
+            coordinate for coordinate in region.coordinates() if coordinate in self.content
+        ]
+        for coordinate in coordinates:
+            self.undraw(coordinate)
 
     def can_print_at(self, at: Coordinate) -> bool:
-        starting_index = self.gui.layers.index(self.gui.get_layer(lambda layer: self is layer)) + 1
-        return not any(layer.is_occupied_at(at) for layer in self.gui.traverse_layers(start=starting_index))
+        return self.gui.compositor.is_visible(self, at)
 
     def new_character_on_erase_at(self, at: Coordinate) -> SupportsString | None:
-        if not self.can_print_at(at):
-            return
-        starting_index = len(self.gui.layers) - self.gui.layers.index(self.gui.get_layer(lambda layer: self is layer))
-        for layer in self.gui.traverse_layers(start=starting_index, reverse=True):
-            if layer.is_occupied_at(at):
-                return layer.content[at]
-        return self.gui.__class__.ERASE_CHARACTER
+        return self.gui.compositor.revealed_at(self, at, self.gui.__class__.ERASE_CHARACTER)
     
     def is_occupied_at(self, at: Coordinate) -> bool:
         return at in self.content
 
+    @serialized
     def clear_content(self) -> None:
-        self.content = {}
+        for at in self.content:
+            self.gui.compositor.vacate(self, at)
+        self.content = Grid()
 
     def get_size(self) -> Coordinate:
-        if not self.content:
-            return Coordinate(0, 0)
-        x = max(self.content, key=lambda coordinate: coordinate.x).x
-        y = max(self.content, key=lambda coordinate: coordinate.y).y
-        return Coordinate(x, y)
+        return self.content.get_size()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import Iterator, TYPE_CHECKING
+if TYPE_CHECKING:
+    from .layer import Layer
+
+
+@dataclass(slots=True)
+class LayerRegistry:
+    layers: list[Layer] = field(default_factory=list, init=False)
+    keys: list[float] = field(default_factory=list, init=False, repr=False)
+    names: dict[str, Layer] = field(default_factory=dict, init=False, repr=False)
+    slots: dict[int, Layer] = field(default_factory=dict, init=False, repr=False)
+
+    def reindex(self, start: int = 0, end: int | None = None) -> None:
+        for index in range(start, len(self.layers) if end is None else end):
+            self.layers[index].index = index
+        # Occupancy bits are keyed by slot, so a restack only recomputes which slots rank above each layer
+        above = 0
+        for layer in reversed(self.layers):
+            layer.above = above
+            above |= 1 << layer.slot
+
+    def add(self, layer: Layer, below_equal: bool = False) -> int:
+        if layer.name in self.names:
+            raise ValueError(f"A layer named {layer.name!r} already exists") from None
+        index = (bisect_left if below_equal else bisect_right)(self.keys, layer.z)
+        self.layers.insert(index, layer)
+        self.keys.insert(index, layer.z)
+        self.names[layer.name] = layer
+        if layer.slot < 0:
+            layer.slot = next(slot for slot in range(len(self.layers)) if slot not in self.slots)
+            self.slots[layer.slot] = layer
+        self.reindex(start=index)
+        return index
+
+    def remove(self, layer: Layer) -> int:
+        index = layer.index
+        if index < 0 or self.layers[index] is not layer:
+            raise ValueError(f"{layer!r} is not registered") from None
+        del self.layers[index]
+        del self.keys[index]
+        del self.names[layer.name]
+        del self.slots[layer.slot]
+        layer.index = layer.slot = -1
+        layer.above = 0
+        self.reindex(start=index)
+        return index
+
+    def move(self, layer: Layer, z: float, below_equal: bool = False) -> tuple[int, int]:
+        start = layer.index
+        if start < 0 or self.layers[start] is not layer:
+            raise ValueError(f"{layer!r} is not registered") from None
+        del self.layers[start]
+        del self.keys[start]
+        layer.z = z
+        end = (bisect_left if below_equal else bisect_right)(self.keys, z)
+        self.layers.insert(end, layer)
+        self.keys.insert(end, z)
+        self.reindex(start=min(start, end))
+        return start, end
+
+    def get(self, name: str) -> Layer | None:
+        return self.names.get(name)
+
+    def top(self) -> Layer:
+        return self.layers[-1]
+
+    def __getitem__(self, index: int | slice) -> Layer | list[Layer]:
+        return self.layers[index]
+
+    def __iter__(self) -> Iterator[Layer]:
+        return iter(self.layers)
+
+    def __reversed__(self) -> Iterator[Layer]:
+        return reversed(self.layers)
+
+    def __len__(self) -> int:
+        return len(self.layers)
+
+    def __contains__(self, layer: object) -> bool:
+        return getattr(layer, "index", -1) >= 0 and self.layers[layer.index] is layer
@@ -1,2 +1,3 @@
 from .killable_thread import KillableThread
+from .hybridmethod import hybridmethod
 from .protocols import SupportsString, SupportsLessThan
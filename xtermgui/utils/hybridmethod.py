@@ -0,0 +1,11 @@
+from __future__ import annotations
+from types import MethodType
+from typing import Any, Callable
+
+
+class hybridmethod:
+    def __init__(self, function: Callable[..., Any]) -> None:
+        self.function = function
+
+    def __get__(self, instance: object | None, owner: type) -> MethodType:
+        return MethodType(self.function, owner if instance is None else instance)